@@ -96,6 +96,13 @@ async def startup_event():
         raise
 
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Release the research system's connections and databases"""
+    if research_service is not None:
+        research_service.close()
+
+
 @app.get("/", response_model=StatusResponse)
 async def root():
     """Root endpoint"""
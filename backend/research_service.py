@@ -4,6 +4,7 @@ Research service that wraps the research system for API usage
 
 import sys
 import logging
+import threading
 import traceback
 from pathlib import Path
 from typing import Optional, Dict, Any
@@ -29,6 +30,15 @@ class ResearchService:
         """Initialize research service"""
         self.system: Optional[ResearchSystem] = None
         self._initialized = False
+        
+        # Guards self.system and the run counts below
+        self._lock = threading.Lock()
+        # Serializes reconfiguration, so concurrent requests asking for the
+        # same new configuration build it only once
+        self._reconfigure_lock = threading.Lock()
+        # Number of research runs in progress on each system; a replaced
+        # system is closed once its last run finishes
+        self._runs: Dict[ResearchSystem, int] = {}
     
     def initialize(
         self,
@@ -50,8 +60,9 @@ class ResearchService:
             # Ensure files directory exists
             Config.ensure_files_dir()
             
-            # Initialize research system
-            self.system = ResearchSystem(
+            # Build the new system completely before replacing the current
+            # one, which requests in flight may still be using
+            system = ResearchSystem(
                 api_key=Config.GROQ_API_KEY,
                 files_dir=str(Config.FILES_DIR),
                 use_wikipedia=use_wikipedia,
@@ -59,9 +70,9 @@ class ResearchService:
                 max_wikipedia_articles=max_wikipedia_articles or Config.WIKIPEDIA_MAX_ARTICLES,
                 max_arxiv_papers=max_arxiv_papers or Config.ARXIV_MAX_PAPERS
             )
+            system.initialize()
             
-            self.system.initialize()
-            self._initialized = True
+            self._replace_system(system)
             
             print("✅ Research service initialized successfully")
             
@@ -69,6 +80,49 @@ class ResearchService:
             print(f"❌ Failed to initialize research service: {e}")
             raise
     
+    def _replace_system(self, system: Optional[ResearchSystem]):
+        """
+        Swap in a new research system and retire the previous one.
+        
+        The previous system is closed right away if no research run is
+        using it, otherwise by the last run to finish (see _release).
+        
+        Args:
+            system: New system, or None to shut the service down
+        """
+        with self._lock:
+            old, self.system = self.system, system
+            self._initialized = system is not None
+            idle = old is not None and not self._runs.get(old)
+        
+        if idle:
+            old.close()
+    
+    def _acquire(self) -> ResearchSystem:
+        """Return the current system, counting one more run on it"""
+        with self._lock:
+            system = self.system
+            if system is None:
+                raise RuntimeError("Research service not initialized")
+            self._runs[system] = self._runs.get(system, 0) + 1
+            return system
+    
+    def _release(self, system: ResearchSystem):
+        """Count a finished run, closing the system if it was replaced meanwhile"""
+        with self._lock:
+            self._runs[system] -= 1
+            if self._runs[system]:
+                return
+            del self._runs[system]
+            retired = system is not self.system
+        
+        if retired:
+            system.close()
+    
+    def close(self):
+        """Shut the service down, closing the system once it is idle"""
+        self._replace_system(None)
+    
     def is_initialized(self) -> bool:
         """Check if service is initialized"""
         return self._initialized and self.system is not None
@@ -119,26 +173,34 @@ class ResearchService:
             if (use_wikipedia is not None or use_arxiv is not None or
                 max_wikipedia_articles is not None or max_arxiv_papers is not None):
                 
-                logger.info("Reinitializing with new scraper configuration...")
-                self.initialize(
-                    use_wikipedia=use_wikipedia if use_wikipedia is not None else True,
-                    use_arxiv=use_arxiv if use_arxiv is not None else True,
-                    max_wikipedia_articles=max_wikipedia_articles,
-                    max_arxiv_papers=max_arxiv_papers
-                )
+                scraper_config = {
+                    "use_wikipedia": use_wikipedia if use_wikipedia is not None else True,
+                    "use_arxiv": use_arxiv if use_arxiv is not None else True,
+                    "max_wikipedia_articles": max_wikipedia_articles or Config.WIKIPEDIA_MAX_ARTICLES,
+                    "max_arxiv_papers": max_arxiv_papers or Config.ARXIV_MAX_PAPERS
+                }
+                with self._reconfigure_lock:
+                    current = self.system
+                    if any(getattr(current, k) != v for k, v in scraper_config.items()):
+                        logger.info("Reinitializing with new scraper configuration...")
+                        self.initialize(**scraper_config)
             
             # Check LLM configuration
             if not Config.GROQ_API_KEY:
                 logger.error("GROQ API key not configured")
                 raise RuntimeError("GROQ_API_KEY not set in environment")
             
-            # Check if we have any sources enabled
-            if not (self.system.use_wikipedia or self.system.use_arxiv or self.system.retriever):
-                logger.warning("No research sources enabled (no PDFs indexed, Wikipedia and ArXiv disabled)")
-            
-            # Perform research
-            logger.info("Starting multi-agent research workflow...")
-            result = self.system.research(topic)
+            system = self._acquire()
+            try:
+                # Check if we have any sources enabled
+                if not (system.use_wikipedia or system.use_arxiv or system.retriever):
+                    logger.warning("No research sources enabled (no PDFs indexed, Wikipedia and ArXiv disabled)")
+                
+                # Perform research
+                logger.info("Starting multi-agent research workflow...")
+                result = system.research(topic)
+            finally:
+                self._release(system)
             
             # Validate result structure
             required_keys = ['topic', 'summary', 'critique_A', 'critique_B', 'insight']
@@ -10,14 +10,16 @@ from pathlib import Path
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from src.research_system import ResearchSystem
 from src.config import Config
-from src.scrapers import WikipediaScraper, ArxivScraper
-from src.retrievers import DocumentLoader, BM25Retriever
+
+# Heavier modules (LangChain, LangGraph, BM25, scrapers) are imported inside
+# each example so the selection menu starts without loading them.
 
 
 def example_1_basic_research():
     """Example 1: Basic research workflow"""
+    from src.research_system import ResearchSystem
+    
     print("\n" + "=" * 80)
     print("EXAMPLE 1: Basic Research Workflow")
     print("=" * 80)
@@ -36,6 +38,8 @@ def example_1_basic_research():
 
 def example_2_wikipedia_only():
     """Example 2: Wikipedia scraping only"""
+    from src.scrapers import WikipediaScraper
+    
     print("\n" + "=" * 80)
     print("EXAMPLE 2: Wikipedia Scraping Only")
     print("=" * 80)
@@ -55,6 +59,8 @@ def example_2_wikipedia_only():
 
 def example_3_arxiv_scraping():
     """Example 3: ArXiv paper scraping"""
+    from src.scrapers import ArxivScraper
+    
     print("\n" + "=" * 80)
     print("EXAMPLE 3: ArXiv Paper Scraping")
     print("=" * 80)
@@ -82,6 +88,8 @@ def example_3_arxiv_scraping():
 
 def example_4_custom_retriever():
     """Example 4: Custom BM25 retriever usage"""
+    from src.retrievers import DocumentLoader, BM25Retriever
+    
     print("\n" + "=" * 80)
     print("EXAMPLE 4: Custom BM25 Retriever")
     print("=" * 80)
@@ -113,6 +121,9 @@ def example_4_custom_retriever():
 
 def example_5_batch_research():
     """Example 5: Batch research on multiple topics"""
+    from concurrent.futures import ThreadPoolExecutor
+    from src.research_system import ResearchSystem
+    
     print("\n" + "=" * 80)
     print("EXAMPLE 5: Batch Research on Multiple Topics")
     print("=" * 80)
@@ -128,12 +139,10 @@ def example_5_batch_research():
         "biodiversity conservation"
     ]
     
-    results = []
-    
-    for topic in topics:
-        print(f"\n🔬 Researching: {topic}")
-        result = system.research(topic)
-        results.append(result)
+    # Each run is dominated by LLM and HTTP latency, so research the topics
+    # concurrently on the shared system (results keep the topic order)
+    with ThreadPoolExecutor(max_workers=min(len(topics), 4)) as executor:
+        results = list(executor.map(system.research, topics))
     
     # Display summary
     print("\n" + "=" * 80)
@@ -149,6 +158,8 @@ def example_5_batch_research():
 
 def example_6_full_system():
     """Example: Use all sources (PDFs + Wikipedia + ArXiv)"""
+    from src.research_system import ResearchSystem
+    
     print("\n" + "="*80)
     print("📚 EXAMPLE 1: Full Multi-Source Research")
     print("="*80 + "\n")
@@ -169,6 +180,8 @@ def example_6_full_system():
 
 def example_7_arxiv_only():
     """Example: Use only ArXiv papers"""
+    from src.research_system import ResearchSystem
+    
     print("\n" + "="*80)
     print("📄 EXAMPLE 2: ArXiv Papers Only")
     print("="*80 + "\n")
@@ -187,6 +200,8 @@ def example_7_arxiv_only():
 
 def example_8_wikipedia_only():
     """Example: Use only Wikipedia"""
+    from src.research_system import ResearchSystem
+    
     print("\n" + "="*80)
     print("🌐 EXAMPLE 3: Wikipedia Only")
     print("="*80 + "\n")
@@ -204,6 +219,8 @@ def example_8_wikipedia_only():
 
 def example_9_custom_limits():
     """Example: Custom document limits"""
+    from src.research_system import ResearchSystem
+    
     print("\n" + "="*80)
     print("⚙️ EXAMPLE 4: Custom Source Limits")
     print("="*80 + "\n")
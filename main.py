@@ -6,7 +6,9 @@ A sophisticated research system that combines BM25 document retrieval,
 Wikipedia scraping, and multi-agent debate for comprehensive topic analysis.
 """
 
+import asyncio
 import sys
+import threading
 from pathlib import Path
 
 # Add src to path
@@ -16,6 +18,36 @@ from src.research_system import ResearchSystem
 from src.config import Config
 
 
+def install_uvloop():
+    """Use uvloop for the asyncio event loops created per research run, if available"""
+    if sys.platform == "win32":
+        return
+    try:
+        import uvloop
+    except ImportError:
+        return
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+
+def read_topic(system: ResearchSystem) -> str:
+    """
+    Prompt for the next topic, warming connections in the background while
+    the user types.
+    
+    Args:
+        system: Initialized research system
+        
+    Returns:
+        Stripped user input
+    """
+    prefetch = threading.Thread(target=system.prefetch, daemon=True)
+    prefetch.start()
+    try:
+        return input("\n🔍 Enter a research topic (or 'exit' to quit): ").strip()
+    finally:
+        prefetch.join(timeout=0.1)
+
+
 def main():
     """Main entry point for the research assistant"""
     print("=" * 80)
@@ -24,6 +56,9 @@ def main():
     print("\nCombining BM25 retrieval + Wikipedia scraping + LangGraph agents")
     print("Debate Pattern: Researcher → Reviewer A & B → Synthesizer\n")
     
+    # Faster event loop for the concurrent source lookups (optional)
+    install_uvloop()
+    
     # Ensure files directory exists
     Config.ensure_files_dir()
     
@@ -42,7 +77,7 @@ def main():
     
     try:
         while True:
-            topic = input("\n🔍 Enter a research topic (or 'exit' to quit): ").strip()
+            topic = read_topic(system)
             
             if topic.lower() in ("exit", "quit", "q"):
                 print("\n👋 Goodbye!")
@@ -53,11 +88,12 @@ def main():
                 continue
             
             try:
-                # Run research
-                result = system.research(topic)
+                # Run research, printing each agent's output as it streams
+                result = system.research(topic, on_token=system.print_token)
                 
-                # Display results
-                system.display_results(result)
+                # Display what was not streamed, then the sources
+                system.display_unstreamed(result)
+                system.display_sources(result)
                 
             except Exception as e:
                 print(f"\n❌ Error during research: {e}")
@@ -71,6 +107,8 @@ def main():
         import traceback
         traceback.print_exc()
         sys.exit(1)
+    finally:
+        system.close()
 
 
 if __name__ == "__main__":
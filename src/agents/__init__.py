@@ -1,10 +1,19 @@
 """Agent modules for multi-agent research system"""
 
-from .base_agent import BaseAgent
-from .researcher_agent import ResearcherAgent
-from .reviewer_agent import ReviewerAgent, ReviewerAgentA, ReviewerAgentB
-from .synthesizer_agent import SynthesizerAgent
-from .state import ResearchState
+from importlib import import_module
+
+# Agents are imported on first access (PEP 562) so that importing one agent,
+# or just the state definition, does not load every agent's dependencies
+_AGENT_MODULES = {
+    'BaseAgent': '.base_agent',
+    'ResearcherAgent': '.researcher_agent',
+    'ReviewerAgent': '.reviewer_agent',
+    'ReviewerAgentA': '.reviewer_agent',
+    'ReviewerAgentB': '.reviewer_agent',
+    'CombinedReviewerAgent': '.reviewer_agent',
+    'SynthesizerAgent': '.synthesizer_agent',
+    'ResearchState': '.state',
+}
 
 __all__ = [
     'BaseAgent',
@@ -12,6 +21,20 @@ __all__ = [
     'ReviewerAgent',
     'ReviewerAgentA',
     'ReviewerAgentB',
+    'CombinedReviewerAgent',
     'SynthesizerAgent',
     'ResearchState'
 ]
+
+
+def __getattr__(name):
+    if name in _AGENT_MODULES:
+        module = import_module(_AGENT_MODULES[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
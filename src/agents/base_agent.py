@@ -2,8 +2,11 @@
 Base agent class for all research agents
 """
 
+import asyncio
+import threading
 from abc import ABC, abstractmethod
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional, Union
+from langchain_core.messages import BaseMessage, HumanMessage, SystemMessage
 from langchain_groq import ChatGroq
 
 from .state import ResearchState
@@ -21,6 +24,8 @@ class BaseAgent(ABC):
             llm: Language model instance
         """
         self.llm = llm
+        self.usage = {"prompt_tokens": 0, "cached_tokens": 0}
+        self._usage_lock = threading.Lock()
     
     @abstractmethod
     def process(self, state: ResearchState) -> Dict[str, Any]:
@@ -35,15 +40,78 @@ class BaseAgent(ABC):
         """
         pass
     
-    def invoke_llm(self, prompt: str) -> str:
+    def invoke_llm(self, prompt: str, system: Optional[str] = None) -> str:
         """
         Invoke the language model with a prompt.
         
+        Going through invoke() lets the model's response cache answer
+        repeated prompts; graph-level token streaming (see
+        ResearchSystem.research) still sees tokens as they are generated,
+        since the model streams whenever a streaming callback is attached.
+        
         Args:
             prompt: Prompt text
+            system: Optional static instructions, sent ahead of the prompt
             
         Returns:
             Model response text
         """
-        resp = self.llm.invoke(prompt)
-        return getattr(resp, "content", None) or str(resp)
+        message = self.llm.invoke(self._build_messages(prompt, system))
+        self._record_usage(getattr(message, "usage_metadata", None))
+        return message.content
+    
+    async def ainvoke_llm(self, prompt: str, system: Optional[str] = None) -> str:
+        """
+        Invoke the language model without blocking the event loop.
+        
+        The call runs on a worker thread over the shared synchronous client,
+        so concurrent agents overlap their requests while still reusing its
+        pooled keep-alive connections (an async client's pool would be tied
+        to the event loop of a single research run).
+        
+        Args:
+            prompt: Prompt text
+            system: Optional static instructions, sent ahead of the prompt
+            
+        Returns:
+            Model response text
+        """
+        return await asyncio.to_thread(self.invoke_llm, prompt, system)
+    
+    @staticmethod
+    def _build_messages(
+        prompt: str,
+        system: Optional[str] = None
+    ) -> Union[str, List[BaseMessage]]:
+        """
+        Build the model input.
+        
+        Static instructions go first as a system message and the per-topic
+        content last, so consecutive requests share an identical prefix that
+        providers with prompt caching can reuse.
+        
+        Args:
+            prompt: Prompt text
+            system: Optional static instructions
+            
+        Returns:
+            Model input (the bare prompt when there are no instructions)
+        """
+        if system is None:
+            return prompt
+        return [SystemMessage(content=system), HumanMessage(content=prompt)]
+    
+    def _record_usage(self, usage_metadata: Optional[Dict[str, Any]]):
+        """
+        Accumulate prompt token usage reported by the model.
+        
+        Args:
+            usage_metadata: Usage metadata of a response chunk, if any
+        """
+        if not usage_metadata:
+            return
+        
+        details = usage_metadata.get("input_token_details") or {}
+        with self._usage_lock:
+            self.usage["prompt_tokens"] += usage_metadata.get("input_tokens", 0)
+            self.usage["cached_tokens"] += details.get("cache_read", 0)
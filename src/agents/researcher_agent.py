@@ -2,11 +2,47 @@
 Researcher agent that gathers information from multiple sources
 """
 
-from typing import Optional, List
+import asyncio
+import logging
+from string import Template
+from typing import TYPE_CHECKING, Optional, List, Tuple
 from .base_agent import BaseAgent
+from .state import NO_TOPIC_SUMMARY, NO_SOURCES_SUMMARY
 from ..retrievers import BM25Retriever
-from ..scrapers import WikipediaScraper, ArxivScraper
 from ..config import Config
+from ..utils.async_utils import run_sync
+from ..utils.text_utils import truncate_text
+
+if TYPE_CHECKING:
+    # Only needed for annotations; importing the scrapers eagerly would
+    # pull in their HTTP/PDF dependencies even when they are disabled
+    from ..scrapers import WikipediaScraper, ArxivScraper
+
+
+logger = logging.getLogger(__name__)
+
+
+# Static instructions, sent first so every call shares the same prefix
+_RESEARCH_SYSTEM_PROMPT = (
+    "You are a research assistant. "
+    "Read the excerpts you are given and produce a concise summary "
+    "of the main findings or facts relevant to the user's topic. "
+    "Be explicit about which sources support which points.\n\n"
+    "Note any search fallback messages or less relevant results to maintain transparency.\n\n"
+    "Return a comprehensive summary that:\n"
+    "1. Synthesizes information from all sources\n"
+    "2. Highlights key findings from academic papers (ArXiv)\n"
+    "3. Incorporates general knowledge (Wikipedia)\n"
+    "4. References specific PDF documents when relevant\n"
+    "5. Notes any search fallbacks or relevance warnings\n"
+    "6. Notes any conflicts or complementary information between sources"
+)
+
+# Per-topic part of the prompt, parsed once at import
+_RESEARCH_TEMPLATE = Template(
+    "The user asked about: '$topic'.\n\n"
+    "EXCERPTS from $source_desc:\n\n$context"
+)
 
 
 class ResearcherAgent(BaseAgent):
@@ -16,8 +52,8 @@ class ResearcherAgent(BaseAgent):
         self,
         llm,
         retriever: Optional[BM25Retriever] = None,
-        wikipedia_scraper: Optional[WikipediaScraper] = None,
-        arxiv_scraper: Optional[ArxivScraper] = None,
+        wikipedia_scraper: Optional["WikipediaScraper"] = None,
+        arxiv_scraper: Optional["ArxivScraper"] = None,
         k: int = 4,
         max_wikipedia_articles: int = 3,
         max_arxiv_papers: int = 3
@@ -46,105 +82,69 @@ class ResearcherAgent(BaseAgent):
         """
         Gather information from all sources and create summary.
         
+        Synchronous entry point kept for LangGraph and existing callers;
+        delegates to :meth:`aprocess` (on a worker thread when called from
+        inside a running event loop).
+        
+        Args:
+            state: Current research state
+        
+        Returns:
+            Updated state with summary and sources
+        """
+        return run_sync(self.aprocess(state))
+    
+    async def aprocess(self, state: dict) -> dict:
+        """
+        Gather information from all sources concurrently and create summary.
+        
+        The BM25, Wikipedia and ArXiv lookups are independent and IO-bound,
+        so they are dispatched together and the research phase takes as long
+        as the slowest source rather than the sum of all three.
+        
         Args:
             state: Current research state
-            
+        
         Returns:
             Updated state with summary and sources
         """
         topic = state.get("topic", "").strip()
         
         if not topic:
-            return {"summary": "No topic provided.", "sources": []}
+            return {"summary": NO_TOPIC_SUMMARY, "sources": []}
         
-        context_pieces = []
-        sources = []
-        
-        # 1. Retrieve from local PDFs using BM25
+        # BM25 scoring is CPU-bound and runs on a worker thread; the
+        # scrapers are awaited directly
+        lookups = []
         if self.retriever:
-            print(f"📄 Searching local PDFs for: '{topic}'")
-            docs = self.retriever.get_relevant_documents(topic, k=self.k)
-            
-            for d in docs:
-                snippet = d.page_content.strip()
-                if len(snippet) > Config.MAX_SNIPPET_LENGTH:
-                    snippet = snippet[:Config.MAX_SNIPPET_LENGTH].rsplit(" ", 1)[0] + " ..."
-                
-                source = d.metadata.get("source", "unknown")
-                chunk_id = d.metadata.get("chunk_id", "")
-                context_pieces.append(
-                    f"[PDF SOURCE: {source} | CHUNK: {chunk_id}]\n{snippet}"
-                )
-                sources.append(f"PDF: {source}")
-        
-        # 2. Scrape Wikipedia
+            lookups.append(("PDF search", asyncio.to_thread(self._search_pdfs, topic)))
         if self.wikipedia_scraper:
-            print(f"🔍 Searching Wikipedia for: '{topic}'")
-            wiki_articles = self.wikipedia_scraper.scrape_by_keywords(
-                topic,
-                max_articles=self.max_wikipedia_articles
-            )
-            
-            wiki_results = wiki_articles.get("results", [])
-            is_fallback = wiki_articles.get("is_fallback", False)
-            fallback_message = wiki_articles.get("message", "")
-            
-            # Add fallback warning if present
-            if is_fallback and fallback_message:
-                context_pieces.append(
-                    f"[WIKIPEDIA SEARCH NOTE: {fallback_message}]"
-                )
-            
-            for article in wiki_results:
-                title = article.get("title", "Unknown")
-                content = article.get("content", "")
-                
-                snippet = content.strip()
-                if len(snippet) > Config.MAX_SNIPPET_LENGTH:
-                    snippet = snippet[:Config.MAX_SNIPPET_LENGTH].rsplit(" ", 1)[0] + " ..."
-                
-                result_type = "WIKIPEDIA (FALLBACK)" if is_fallback else "WIKIPEDIA"
-                context_pieces.append(
-                    f"[{result_type}: {title}]\n{snippet}"
-                )
-                source_prefix = "Wikipedia (Fallback)" if is_fallback else "Wikipedia"
-                sources.append(f"{source_prefix}: {title}")
-        
-        # 3. Scrape ArXiv papers
+            lookups.append(("Wikipedia scraping", self._search_wikipedia(topic)))
         if self.arxiv_scraper:
-            print(f"📚 Searching ArXiv for: '{topic}'")
-            try:
-                arxiv_papers = self.arxiv_scraper.scrape_articles(
-                    query=topic,
-                    max_results=self.max_arxiv_papers,
-                    save_pdf=False,  # Don't save PDFs
-                    extract_content=True  # Extract text content
-                )
-                
-                for paper in arxiv_papers:
-                    title = paper.get("title", "Unknown")
-                    content = paper.get("content", "")
-                    abstract = paper.get("abstract", "")
-                    
-                    # Use content if available, otherwise use abstract
-                    text = content if content and not content.startswith("[") else abstract
-                    
-                    if text:
-                        snippet = text.strip()
-                        if len(snippet) > Config.MAX_SNIPPET_LENGTH:
-                            snippet = snippet[:Config.MAX_SNIPPET_LENGTH].rsplit(" ", 1)[0] + " ..."
-                        
-                        context_pieces.append(
-                            f"[ARXIV: {title}]\n{snippet}"
-                        )
-                        sources.append(f"ArXiv: {title}")
-            except Exception as e:
-                print(f"⚠️  ArXiv scraping failed: {e}")
+            lookups.append(("ArXiv scraping", self._search_arxiv(topic)))
+        
+        results = await asyncio.gather(
+            *(lookup for _, lookup in lookups),
+            return_exceptions=True
+        )
+        
+        context_pieces = []
+        sources = []
+        
+        # Merge in source order (PDFs, Wikipedia, ArXiv) regardless of
+        # which lookup finished first
+        for (label, _), result in zip(lookups, results):
+            if isinstance(result, Exception):
+                logger.warning("⚠️  %s failed: %s", label, result)
+                continue
+            pieces, piece_sources = result
+            context_pieces.extend(pieces)
+            sources.extend(piece_sources)
         
         # Check if we have any sources
         if not context_pieces:
             return {
-                "summary": "No relevant information found from any source.",
+                "summary": NO_SOURCES_SUMMARY,
                 "sources": []
             }
         
@@ -162,32 +162,136 @@ class ResearcherAgent(BaseAgent):
         
         source_desc = ", ".join(source_types)
         
-        prompt = (
-            f"You are a research assistant. The user asked about: '{topic}'.\n\n"
-            f"Read the following excerpts from {source_desc} and produce a concise summary "
-            f"of the main findings or facts relevant to the topic. "
-            f"Be explicit about which sources support which points.\n\n"
-            f"Note any search fallback messages or less relevant results to maintain transparency.\n\n"
-            f"EXCERPTS:\n\n{context}\n\n"
-            "Return a comprehensive summary that:\n"
-            "1. Synthesizes information from all sources\n"
-            "2. Highlights key findings from academic papers (ArXiv)\n"
-            "3. Incorporates general knowledge (Wikipedia)\n"
-            "4. References specific PDF documents when relevant\n"
-            "5. Notes any search fallbacks or relevance warnings\n"
-            "6. Notes any conflicts or complementary information between sources"
+        prompt = _RESEARCH_TEMPLATE.substitute(
+            topic=topic,
+            source_desc=source_desc,
+            context=context
         )
         
-        # Get LLM response
-        resp = self.llm.invoke(prompt)
-        summary_text = getattr(resp, "content", None) or str(resp)
-        
         # Remove duplicate sources while preserving order
-        unique_sources = list(dict.fromkeys(sources))
+        seen = set()
+        unique_sources = [s for s in sources if not (s in seen or seen.add(s))]
         
-        print(f"✅ Gathered information from {len(unique_sources)} sources")
+        # Logged before the summary is generated, so the message does not
+        # land in the middle of the streamed summary
+        logger.info("✅ Gathered information from %d sources", len(unique_sources))
+        
+        # Get LLM response
+        summary_text = await self.ainvoke_llm(prompt, _RESEARCH_SYSTEM_PROMPT)
         
         return {
             "summary": summary_text,
             "sources": unique_sources
         }
+    
+    def _search_pdfs(self, topic: str) -> Tuple[List[str], List[str]]:
+        """
+        Retrieve excerpts from local PDFs using BM25.
+        
+        Args:
+            topic: Research topic
+        
+        Returns:
+            Tuple of (context pieces, source labels)
+        """
+        logger.info("📄 Searching local PDFs for: '%s'", topic)
+        docs = self.retriever.get_relevant_documents(topic, k=self.k)
+        
+        # Build each field in one pass over the hits, then zip them together
+        snippets = [
+            truncate_text(d.page_content.strip(), Config.MAX_SNIPPET_LENGTH)
+            for d in docs
+        ]
+        doc_sources = [d.metadata.get("source", "unknown") for d in docs]
+        chunk_ids = [d.metadata.get("chunk_id", "") for d in docs]
+        
+        context_pieces = [
+            f"[PDF SOURCE: {source} | CHUNK: {chunk_id}]\n{snippet}"
+            for source, chunk_id, snippet in zip(doc_sources, chunk_ids, snippets)
+        ]
+        sources = [f"PDF: {source}" for source in doc_sources]
+        
+        return context_pieces, sources
+    
+    async def _search_wikipedia(self, topic: str) -> Tuple[List[str], List[str]]:
+        """
+        Retrieve excerpts from Wikipedia articles.
+        
+        Args:
+            topic: Research topic
+        
+        Returns:
+            Tuple of (context pieces, source labels)
+        """
+        logger.info("🔍 Searching Wikipedia for: '%s'", topic)
+        wiki_articles = await self.wikipedia_scraper.ascrape_by_keywords(
+            topic,
+            max_articles=self.max_wikipedia_articles
+        )
+        
+        wiki_results = wiki_articles.get("articles", [])
+        is_fallback = wiki_articles.get("is_fallback", False)
+        fallback_message = wiki_articles.get("message", "")
+        
+        result_type = "WIKIPEDIA (FALLBACK)" if is_fallback else "WIKIPEDIA"
+        source_prefix = "Wikipedia (Fallback)" if is_fallback else "Wikipedia"
+        
+        titles = [article.get("title", "Unknown") for article in wiki_results]
+        snippets = [
+            truncate_text(article.get("content", "").strip(), Config.MAX_SNIPPET_LENGTH)
+            for article in wiki_results
+        ]
+        
+        context_pieces = []
+        
+        # Add fallback warning if present
+        if is_fallback and fallback_message:
+            context_pieces.append(
+                f"[WIKIPEDIA SEARCH NOTE: {fallback_message}]"
+            )
+        
+        context_pieces.extend(
+            f"[{result_type}: {title}]\n{snippet}"
+            for title, snippet in zip(titles, snippets)
+        )
+        sources = [f"{source_prefix}: {title}" for title in titles]
+        
+        return context_pieces, sources
+    
+    async def _search_arxiv(self, topic: str) -> Tuple[List[str], List[str]]:
+        """
+        Retrieve excerpts from ArXiv papers.
+        
+        Args:
+            topic: Research topic
+        
+        Returns:
+            Tuple of (context pieces, source labels)
+        """
+        logger.info("📚 Searching ArXiv for: '%s'", topic)
+        arxiv_papers = await self.arxiv_scraper.ascrape_articles(
+            query=topic,
+            max_results=self.max_arxiv_papers,
+            save_pdf=False,  # Don't save PDFs
+            extract_content=True  # Extract text content
+        )
+        
+        # Use content if available, otherwise use abstract
+        contents = [paper.get("content") or "" for paper in arxiv_papers]
+        texts = [
+            content if content and not content.startswith("[") else paper.get("abstract", "")
+            for paper, content in zip(arxiv_papers, contents)
+        ]
+        papers = [
+            (paper.get("title", "Unknown"), text)
+            for paper, text in zip(arxiv_papers, texts)
+            if text
+        ]
+        
+        context_pieces = [
+            f"[ARXIV: {title}]\n{truncate_text(text.strip(), Config.MAX_SNIPPET_LENGTH)}"
+            for title, text in papers
+        ]
+        sources = [f"ArXiv: {title}" for title, _ in papers]
+        
+        return context_pieces, sources
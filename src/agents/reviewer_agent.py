@@ -2,11 +2,53 @@
 Reviewer agents for critical analysis of research summaries
 """
 
-from typing import Dict, Any
+import re
+from typing import Dict, Any, List, Optional
 from langchain_groq import ChatGroq
 
 from .base_agent import BaseAgent
-from .state import ResearchState
+from .state import ResearchState, NO_SUMMARY_CRITIQUE
+
+
+# Matches section headers such as "## Reviewer A", "**Reviewer B:** text" or
+# a bare "Reviewer A:" line. Only a Markdown heading or a bold line start
+# counts as a header prefix, so a bullet such as "* Reviewer B would..."
+# inside a section is not mistaken for one. The match ends at the header,
+# leaving any text after it on the same line to the section.
+_SECTION_RE = re.compile(
+    r"""
+    ^[ \t]*
+    (?:
+        (?:\#{1,6}[ \t]*(?:\*\*)?|\*\*)[ \t]*
+        Reviewer[ \t]+(?P<name>[A-Za-z0-9]+)\b
+        [ \t]*(?:\*\*)?[ \t]*:?[ \t]*(?:\*\*)?[ \t]*
+    |
+        Reviewer[ \t]+(?P<bare>[A-Za-z0-9]+)[ \t]*:?[ \t]*$
+    )
+    """,
+    re.MULTILINE | re.IGNORECASE | re.VERBOSE
+)
+
+
+
+def _build_review_prompt(state: ResearchState) -> Optional[str]:
+    """
+    Build the per-topic part of the review prompt, shared by the separate
+    and the combined reviewers so both review the same input.
+    
+    Args:
+        state: Current research state
+        
+    Returns:
+        Prompt text, or None if there is no summary to review
+    """
+    topic = state.get("topic", "")
+    summary = state.get("summary", "")
+    
+    if not summary:
+        return None
+    
+    return f"User asked about: '{topic}'.\n\nSUMMARY:\n\n{summary}"
 
 
 class ReviewerAgent(BaseAgent):
@@ -24,6 +66,12 @@ class ReviewerAgent(BaseAgent):
         super().__init__(llm)
         self.name = name
         self.focus = focus
+        self.system_prompt = (
+            f"You are Reviewer {self.name}. "
+            "Critically assess the research summary you are given.\n"
+            f"{self.focus}\n"
+            "Provide bullet points."
+        )
     
     def process(self, state: ResearchState) -> Dict[str, Any]:
         """
@@ -35,21 +83,30 @@ class ReviewerAgent(BaseAgent):
         Returns:
             Dictionary with critique
         """
-        topic = state.get("topic", "")
-        summary = state.get("summary", "")
+        prompt = _build_review_prompt(state)
+        if prompt is None:
+            return {f"critique_{self.name}": NO_SUMMARY_CRITIQUE}
         
-        if not summary:
-            return {f"critique_{self.name}": "No summary to review."}
+        critique_text = self.invoke_llm(prompt, self.system_prompt)
         
-        prompt = (
-            f"You are Reviewer {self.name}. User asked about: '{topic}'. "
-            f"Critically assess the summary.\n"
-            f"{self.focus}\n\n"
-            f"SUMMARY:\n\n{summary}\n\n"
-            "Provide bullet points."
-        )
+        return {f"critique_{self.name}": critique_text}
+    
+    async def aprocess(self, state: ResearchState) -> Dict[str, Any]:
+        """
+        Review and critique a research summary without blocking the event
+        loop, so parallel reviewer nodes overlap their LLM calls.
+        
+        Args:
+            state: Current research state
+            
+        Returns:
+            Dictionary with critique
+        """
+        prompt = _build_review_prompt(state)
+        if prompt is None:
+            return {f"critique_{self.name}": NO_SUMMARY_CRITIQUE}
         
-        critique_text = self.invoke_llm(prompt)
+        critique_text = await self.ainvoke_llm(prompt, self.system_prompt)
         
         return {f"critique_{self.name}": critique_text}
 
@@ -74,3 +131,105 @@ class ReviewerAgentB(ReviewerAgent):
             name="B",
             focus="Focus on possible gaps, biases, or alternative interpretations."
         )
+
+
+class CombinedReviewerAgent(BaseAgent):
+    """Reviewer issuing a single LLM call on behalf of several reviewers"""
+    
+    def __init__(self, llm: ChatGroq, reviewers: Optional[List[ReviewerAgent]] = None):
+        """
+        Initialize combined reviewer agent.
+        
+        Args:
+            llm: Language model instance
+            reviewers: Reviewers whose critiques are produced in one call
+                (defaults to Reviewer A and Reviewer B)
+        """
+        super().__init__(llm)
+        self.reviewers = reviewers or [ReviewerAgentA(llm), ReviewerAgentB(llm)]
+        
+        sections = "\n".join(
+            f"## Reviewer {r.name}\n{r.focus}" for r in self.reviewers
+        )
+        self.system_prompt = (
+            f"You are a panel of {len(self.reviewers)} independent reviewers. "
+            "Each reviewer critically assesses the research summary you are "
+            f"given from their own focus:\n\n{sections}\n\n"
+            "Answer with one section per reviewer, each starting with its exact "
+            "header line (for example '## Reviewer A'), and provide bullet points."
+        )
+    
+    def process(self, state: ResearchState) -> Dict[str, Any]:
+        """
+        Review a research summary from every reviewer's perspective at once.
+        
+        The summary is sent to the model a single time and the response is
+        split into one labeled section per reviewer.
+        
+        Args:
+            state: Current research state
+            
+        Returns:
+            Dictionary with one critique per reviewer
+        """
+        prompt = _build_review_prompt(state)
+        if prompt is None:
+            return self._no_summary_critiques()
+        
+        response = self.invoke_llm(prompt, self.system_prompt)
+        
+        return self._split_critiques(response)
+    
+    async def aprocess(self, state: ResearchState) -> Dict[str, Any]:
+        """
+        Review a research summary from every reviewer's perspective at once,
+        without blocking the event loop.
+        
+        Args:
+            state: Current research state
+            
+        Returns:
+            Dictionary with one critique per reviewer
+        """
+        prompt = _build_review_prompt(state)
+        if prompt is None:
+            return self._no_summary_critiques()
+        
+        response = await self.ainvoke_llm(prompt, self.system_prompt)
+        
+        return self._split_critiques(response)
+    
+    def _no_summary_critiques(self) -> Dict[str, str]:
+        """Placeholder critiques used when there is no summary to review"""
+        return {
+            f"critique_{r.name}": NO_SUMMARY_CRITIQUE
+            for r in self.reviewers
+        }
+    
+    def _split_critiques(self, response: str) -> Dict[str, str]:
+        """
+        Split a combined response into per-reviewer critiques.
+        
+        Args:
+            response: Model response containing one section per reviewer
+            
+        Returns:
+            Dictionary mapping critique keys to section text. Reviewers whose
+            section is missing receive the full response.
+        """
+        names = {r.name.upper(): r.name for r in self.reviewers}
+        matches = []
+        for match in _SECTION_RE.finditer(response):
+            label = (match.group("name") or match.group("bare")).upper()
+            if label in names:
+                matches.append((names[label], match))
+        
+        sections: Dict[str, str] = {}
+        for i, (name, match) in enumerate(matches):
+            end = matches[i + 1][1].start() if i + 1 < len(matches) else len(response)
+            sections.setdefault(name, response[match.end():end].strip())
+        
+        return {
+            f"critique_{r.name}": sections.get(r.name) or response.strip()
+            for r in self.reviewers
+        }
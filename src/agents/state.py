@@ -5,6 +5,12 @@ State definition for the research workflow
 from typing import TypedDict, Optional, List
 
 
+# Placeholder texts written to the state when an agent has nothing to work on
+NO_TOPIC_SUMMARY = "No topic provided."
+NO_SOURCES_SUMMARY = "No relevant information found from any source."
+NO_SUMMARY_CRITIQUE = "No summary to review."
+
+
 class ResearchState(TypedDict):
     """Shared state for the multi-agent research system"""
     topic: str
@@ -2,11 +2,37 @@
 Synthesizer agent for combining research and critiques
 """
 
+from string import Template
 from typing import Dict, Any
 from langchain_groq import ChatGroq
 
 from .base_agent import BaseAgent
-from .state import ResearchState
+from .state import (
+    ResearchState,
+    NO_TOPIC_SUMMARY,
+    NO_SOURCES_SUMMARY,
+    NO_SUMMARY_CRITIQUE
+)
+
+
+# Static instructions, sent first so every call shares the same prefix
+_SYNTH_SYSTEM_PROMPT = (
+    "You are a synthesizer. "
+    "Combine the summary and two independent critiques you are given into a "
+    "'Collective Insight Report'. Include:\n"
+    "- 2-3 sentence actionable insight\n"
+    "- 2 testable hypotheses or follow-up experiments\n"
+    "- References to relevant sources or snippets supporting each hypothesis"
+)
+
+# Per-topic part of the prompt, parsed once at import
+_SYNTH_TEMPLATE = Template(
+    "User asked about: '$topic'.\n\n"
+    "SUMMARY:\n$summary\n\n"
+    "CRITIQUE A:\n$critique_a\n\n"
+    "CRITIQUE B:\n$critique_b\n\n"
+    "SOURCES:\n$sources"
+)
 
 
 class SynthesizerAgent(BaseAgent):
@@ -37,18 +63,25 @@ class SynthesizerAgent(BaseAgent):
         critique_B = state.get("critique_B", "")
         sources = state.get("sources", [])
         
-        prompt = (
-            f"You are a synthesizer. User asked about: '{topic}'.\n"
-            "Combine the summary and two independent critiques into a 'Collective Insight Report'. Include:\n"
-            "- 2-3 sentence actionable insight\n"
-            "- 2 testable hypotheses or follow-up experiments\n"
-            "- References to relevant sources or snippets supporting each hypothesis\n\n"
-            f"SUMMARY:\n{summary}\n\n"
-            f"CRITIQUE A:\n{critique_A}\n\n"
-            f"CRITIQUE B:\n{critique_B}\n\n"
-            f"SOURCES:\n{', '.join(sources)}"
+        # Nothing to synthesize: skip the LLM round-trip
+        if (
+            not summary
+            or summary in (NO_TOPIC_SUMMARY, NO_SOURCES_SUMMARY)
+            or all(c in ("", NO_SUMMARY_CRITIQUE) for c in (critique_A, critique_B))
+        ):
+            return {
+                "insight": f"Insufficient evidence for topic '{topic}'. "
+                           f"Summary: {summary or 'none'}"
+            }
+        
+        prompt = _SYNTH_TEMPLATE.substitute(
+            topic=topic,
+            summary=summary,
+            critique_a=critique_A,
+            critique_b=critique_B,
+            sources=", ".join(sources)
         )
         
-        insight_text = self.invoke_llm(prompt)
+        insight_text = self.invoke_llm(prompt, _SYNTH_SYSTEM_PROMPT)
         
         return {"insight": insight_text}
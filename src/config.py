@@ -13,6 +13,9 @@ class Config:
     # Project paths
     PROJECT_ROOT = Path(__file__).parent.parent
     FILES_DIR = PROJECT_ROOT / "files"
+    CACHE_DIR = FILES_DIR / ".cache"
+    GRAPH_CHECKPOINT_DB = CACHE_DIR / "graph_checkpoints.sqlite3"
+    LLM_CACHE_DB = CACHE_DIR / "llm_cache.sqlite3"
     
     # ============================================================================
     # API Configuration - CHANGE THIS BEFORE RUNNING!
@@ -30,6 +33,22 @@ class Config:
     # LLM Configuration
     LLM_MODEL = "llama-3.1-8b-instant"
     LLM_TEMPERATURE = 0
+    LLM_TIMEOUT = 30
+    LLM_API_BASE = "https://api.groq.com"
+    LLM_MAX_KEEPALIVE_CONNECTIONS = 8
+    
+    # Reuse responses to identical prompts (only sound while LLM_TEMPERATURE
+    # is 0); entries are kept in memory and on disk for LLM_CACHE_TTL seconds
+    LLM_CACHE_ENABLED = True
+    LLM_CACHE_SIZE = 256
+    LLM_CACHE_TTL = 7 * 86400
+    
+    # Run Reviewer A and B as two parallel LLM calls (True) or as a single
+    # combined call that sends the summary once (False)
+    PARALLEL_REVIEWERS = False
+    
+    # Number of most recent research runs whose graph checkpoints are kept
+    GRAPH_CHECKPOINT_RETAIN = 1
     
     # Document Processing
     CHUNK_SIZE = 1000
@@ -39,9 +58,22 @@ class Config:
     BM25_TOP_K = 4
     WIKIPEDIA_MAX_ARTICLES = 3
     
+    # Scraper results are cached on disk for this many seconds
+    SCRAPER_CACHE_TTL = 86400
+    
+    # Maximum number of pages/PDFs a scraper downloads at the same time
+    SCRAPER_MAX_CONCURRENCY = 5
+    
+    # Downloaded arXiv PDFs are kept on disk up to this total size; the
+    # least recently used ones are deleted beyond it
+    ARXIV_PDF_CACHE_MAX_BYTES = 500 * 1024 * 1024
+    
     # Snippet Configuration
     MAX_SNIPPET_LENGTH = 800
     
+    # Print per-step progress messages from the agents
+    VERBOSE = True
+    
     @classmethod
     def ensure_files_dir(cls):
         """Ensure the files directory exists"""
@@ -2,9 +2,24 @@
 Main research system orchestrating multi-agent workflow
 """
 
-from typing import Optional
+import asyncio
+import hashlib
+import logging
+import shutil
+import sqlite3
+import sys
+import threading
+from collections import deque
+from importlib.util import find_spec
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+from uuid import uuid4
+import httpx
 from langchain_groq import ChatGroq
-from langgraph.graph import StateGraph
+from langgraph.checkpoint.base import BaseCheckpointSaver
+from langgraph.checkpoint.memory import MemorySaver
+from langgraph.graph import END, StateGraph
+from langgraph.types import Send
 
 from .config import Config
 from .agents import (
@@ -12,10 +27,31 @@ from .agents import (
     ResearcherAgent,
     ReviewerAgentA,
     ReviewerAgentB,
+    CombinedReviewerAgent,
     SynthesizerAgent
 )
+from .agents.state import NO_SOURCES_SUMMARY, NO_SUMMARY_CRITIQUE
 from .retrievers import BM25Retriever, DocumentLoader
-from .scrapers import WikipediaScraper, ArxivScraper
+from .utils import LLMCache, AsyncSqliteSaver, SQLITE_CHECKPOINT_AVAILABLE, run_sync
+
+# HTTP/2 support in httpx requires the optional 'h2' package
+HTTP2_AVAILABLE = find_spec("h2") is not None
+
+
+def _configure_logging():
+    """
+    Route the progress messages of the agents, loaders and scrapers to
+    stdout, at INFO level when Config.VERBOSE is set and WARNING otherwise.
+    
+    Only this package's logger is configured; if the host application
+    already set up logging, messages propagate to its handlers instead.
+    """
+    package_logger = logging.getLogger(__package__)
+    package_logger.setLevel(logging.INFO if Config.VERBOSE else logging.WARNING)
+    if not package_logger.handlers and not logging.getLogger().handlers:
+        handler = logging.StreamHandler(sys.stdout)
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        package_logger.addHandler(handler)
 
 
 class ResearchSystem:
@@ -41,14 +77,31 @@ class ResearchSystem:
             max_wikipedia_articles: Maximum Wikipedia articles to retrieve
             max_arxiv_papers: Maximum ArXiv papers to retrieve
         """
+        _configure_logging()
+        
         # Set API key
         if api_key:
             Config.set_groq_api_key(api_key)
         
-        # Initialize LLM
+        # Initialize LLM on a pooled keep-alive HTTP client, so the calls
+        # made by every agent reuse the same TLS connections
+        self.http_client = httpx.Client(
+            http2=HTTP2_AVAILABLE,
+            timeout=Config.LLM_TIMEOUT,
+            limits=httpx.Limits(
+                max_keepalive_connections=Config.LLM_MAX_KEEPALIVE_CONNECTIONS
+            )
+        )
+        self.llm_cache = LLMCache(
+            max_size=Config.LLM_CACHE_SIZE,
+            ttl=Config.LLM_CACHE_TTL,
+            path=Config.LLM_CACHE_DB
+        )
         self.llm = ChatGroq(
             model=Config.LLM_MODEL,
-            temperature=Config.LLM_TEMPERATURE
+            temperature=Config.LLM_TEMPERATURE,
+            http_client=self.http_client,
+            cache=self.llm_cache if Config.LLM_CACHE_ENABLED else False
         )
         
         # Set files directory
@@ -56,6 +109,7 @@ class ResearchSystem:
         
         # Initialize components
         self.retriever: Optional[BM25Retriever] = None
+        self._corpus_key: Optional[str] = None
         
         # Initialize scrapers based on configuration
         self.use_wikipedia = use_wikipedia
@@ -63,31 +117,77 @@ class ResearchSystem:
         self.max_wikipedia_articles = max_wikipedia_articles
         self.max_arxiv_papers = max_arxiv_papers
         
-        self.wikipedia_scraper = WikipediaScraper() if use_wikipedia else None
-        self.arxiv_scraper = ArxivScraper() if use_arxiv else None
+        # Scraper modules are imported only when enabled to keep their
+        # dependencies (requests, lxml, feedparser, PDF parsers) off the startup path
+        self.wikipedia_scraper = None
+        if use_wikipedia:
+            from .scrapers import WikipediaScraper
+            self.wikipedia_scraper = WikipediaScraper()
+        
+        self.arxiv_scraper = None
+        if use_arxiv:
+            from .scrapers import ArxivScraper
+            self.arxiv_scraper = ArxivScraper()
         
         # Initialize agents
         self.researcher: Optional[ResearcherAgent] = None
         self.reviewer_a: Optional[ReviewerAgentA] = None
         self.reviewer_b: Optional[ReviewerAgentB] = None
+        self.combined_reviewer: Optional[CombinedReviewerAgent] = None
         self.synthesizer: Optional[SynthesizerAgent] = None
         
-        # Workflow graph
+        # Workflow graph (compiled once, checkpointed per research thread)
         self.app = None
+        self.checkpointer: Optional[BaseCheckpointSaver] = None
+        self.last_thread_id: Optional[str] = None
+        # Finished runs whose checkpoints are still stored, oldest first
+        self._retained_threads: deque = deque()
+        # Whether the compiled graph runs the agents or the no-sources node
+        self._graph_has_sources: Optional[bool] = None
+        
+        # Node whose tokens are currently being printed by print_token
+        self._streaming_node: Optional[str] = None
+        
+        # Nodes that printed at least one token since the last display_sources
+        self._streamed_nodes = set()
+        
+        # Guards the retriever refresh when research() runs from several threads
+        self._lock = threading.Lock()
     
-    def initialize(self):
-        """Initialize the research system by loading documents and building index"""
-        print("📥 Ingesting PDFs and building BM25 index...")
+    def __enter__(self) -> "ResearchSystem":
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def close(self):
+        """
+        Release the HTTP connections and sqlite databases held by the system.
+        
+        The system cannot run research afterwards; create a new one instead.
+        Calling close() more than once is harmless.
+        """
+        self.app = None
         
-        # Load and index documents
-        doc_loader = DocumentLoader()
-        chunks = doc_loader.load_and_chunk_pdfs(self.files_dir)
+        self.http_client.close()
+        for scraper in (self.wikipedia_scraper, self.arxiv_scraper):
+            if scraper is not None:
+                scraper.session.close()
         
-        if chunks:
-            self.retriever = BM25Retriever(chunks)
-            print("✅ BM25 index ready.")
-        else:
-            print("⚠️  BM25 retriever not created (no chunks).")
+        self.llm_cache.close()
+        
+        # The sqlite checkpointer owns its connection; MemorySaver has none
+        conn = getattr(self.checkpointer, "conn", None)
+        if conn is not None:
+            conn.close()
+        self.checkpointer = None
+    
+    def initialize(self):
+        """Initialize the research system by loading documents and building index"""
+        # Load and index documents (reuses the existing index if the PDFs
+        # have not changed since the last build)
+        if not self._refresh_retriever():
+            print("✅ BM25 index unchanged, reusing existing retriever.")
         
         # Display scraper configuration
         scrapers_enabled = []
@@ -112,6 +212,9 @@ class ResearchSystem:
         )
         self.reviewer_a = ReviewerAgentA(self.llm)
         self.reviewer_b = ReviewerAgentB(self.llm)
+        self.combined_reviewer = CombinedReviewerAgent(
+            self.llm, [self.reviewer_a, self.reviewer_b]
+        )
         self.synthesizer = SynthesizerAgent(self.llm)
         
         # Build workflow graph
@@ -122,32 +225,227 @@ class ResearchSystem:
     def _build_graph(self):
         """Build the LangGraph workflow"""
         graph = StateGraph(ResearchState)
+        self._graph_has_sources = self._has_sources()
+        
+        if not self._graph_has_sources:
+            # No PDFs indexed and no scrapers: every agent would only pass
+            # placeholders along, so answer directly without any LLM call
+            graph.add_node("empty", self._no_sources)
+            graph.set_entry_point("empty")
+            graph.add_edge("empty", END)
+            self.app = graph.compile(checkpointer=self._get_checkpointer())
+            return
         
-        # Add nodes
-        graph.add_node("researcher", self.researcher.process)
-        graph.add_node("reviewer_A", self.reviewer_a.process)
-        graph.add_node("reviewer_B", self.reviewer_b.process)
+        # Add nodes (async where the node waits on I/O, so LangGraph runs
+        # nodes of the same superstep concurrently on one event loop)
+        graph.add_node("researcher", self.researcher.aprocess)
         graph.add_node("synthesizer", self.synthesizer.process)
         
-        # Add edges (debate pattern)
-        graph.add_edge("researcher", "reviewer_A")
-        graph.add_edge("researcher", "reviewer_B")
-        graph.add_edge("reviewer_A", "synthesizer")
-        graph.add_edge("reviewer_B", "synthesizer")
+        if Config.PARALLEL_REVIEWERS:
+            graph.add_node("reviewer_A", self.reviewer_a.aprocess)
+            graph.add_node("reviewer_B", self.reviewer_b.aprocess)
+            
+            # Add edges (debate pattern): fan out to both reviewers in the
+            # same superstep, then fan back in to the synthesizer
+            graph.add_conditional_edges(
+                "researcher",
+                self._dispatch_reviewers,
+                ["reviewer_A", "reviewer_B"]
+            )
+            graph.add_edge("reviewer_A", "synthesizer")
+            graph.add_edge("reviewer_B", "synthesizer")
+        else:
+            # Both critiques come from a single LLM call over the summary
+            graph.add_node("reviewers", self.combined_reviewer.aprocess)
+            graph.add_edge("researcher", "reviewers")
+            graph.add_edge("reviewers", "synthesizer")
         
         # Set entry point
         graph.set_entry_point("researcher")
         
         # Compile graph
-        self.app = graph.compile()
+        self.app = graph.compile(checkpointer=self._get_checkpointer())
+    
+    def _get_checkpointer(self) -> BaseCheckpointSaver:
+        """
+        Get the checkpointer shared by every research run.
+        
+        Uses an on-disk SqliteSaver when langgraph-checkpoint-sqlite is
+        installed so runs can be inspected or replayed later, and an
+        in-memory saver otherwise. The database may be shared with other
+        processes, so only the threads this instance created are ever
+        pruned (see _retain_checkpoints).
+        
+        Returns:
+            Checkpointer instance
+        """
+        if self.checkpointer is None:
+            if SQLITE_CHECKPOINT_AVAILABLE:
+                Config.GRAPH_CHECKPOINT_DB.parent.mkdir(parents=True, exist_ok=True)
+                conn = sqlite3.connect(
+                    str(Config.GRAPH_CHECKPOINT_DB),
+                    check_same_thread=False
+                )
+                self.checkpointer = AsyncSqliteSaver(conn)
+            else:
+                self.checkpointer = MemorySaver()
+        return self.checkpointer
+    
+    def _get_corpus_key(self) -> str:
+        """
+        Compute a cheap fingerprint of the PDF corpus.
+        
+        Returns:
+            sha256 of the sorted (name, mtime, size) of every PDF, together
+            with the chunking settings the index depends on
+        """
+        files = sorted(
+            (p.name, p.stat().st_mtime, p.stat().st_size)
+            for p in Path(self.files_dir).glob("*.pdf")
+        )
+        return hashlib.sha256(
+            repr((Config.CHUNK_SIZE, Config.CHUNK_OVERLAP, files)).encode()
+        ).hexdigest()
+    
+    def _refresh_retriever(self) -> bool:
+        """
+        Build the BM25 retriever, unless the corpus is unchanged since the
+        last build.
+        
+        Indexes are persisted under Config.CACHE_DIR keyed by the corpus
+        fingerprint, so a fresh process with unchanged PDFs memory-maps the
+        saved index instead of parsing and tokenizing the PDFs again.
+        
+        Returns:
+            True if the index was (re)built or loaded, False if it was reused
+        """
+        corpus_key = self._get_corpus_key()
+        if corpus_key == self._corpus_key:
+            return False
+        
+        index_dir = Config.CACHE_DIR / f"{self._index_prefix()}{corpus_key}"
+        self.retriever = None
+        
+        if index_dir.exists():
+            try:
+                self.retriever = BM25Retriever.load(index_dir)
+                print("✅ BM25 index loaded from cache.")
+            except (OSError, ValueError, KeyError, TypeError) as e:
+                print(f"⚠️  Could not load cached BM25 index: {e}")
+        
+        if self.retriever is None:
+            print("📥 Ingesting PDFs and building BM25 index...")
+            
+            doc_loader = DocumentLoader()
+            chunks = doc_loader.load_and_chunk_pdfs(self.files_dir)
+            
+            if chunks:
+                self.retriever = BM25Retriever(chunks)
+                try:
+                    self.retriever.save(index_dir)
+                except OSError as e:
+                    print(f"⚠️  Could not save BM25 index: {e}")
+                else:
+                    self._prune_indexes(index_dir, self._index_prefix())
+                print("✅ BM25 index ready.")
+            else:
+                print("⚠️  BM25 retriever not created (no chunks).")
+        
+        if self.retriever:
+            self.retriever.warmup()
+        
+        self._corpus_key = corpus_key
+        
+        if self.researcher:
+            self.researcher.retriever = self.retriever
+        
+        return True
+    
+    @staticmethod
+    def _prune_indexes(keep: Path, prefix: str):
+        """
+        Delete the saved BM25 indexes of earlier versions of this PDF folder,
+        so the cache directory holds one index per folder instead of one per
+        PDF change. Indexes of other folders (another system sharing
+        Config.CACHE_DIR) are left alone, and so are directories still being
+        written (``.tmp`` suffix).
+        
+        Args:
+            keep: Index directory that was just saved
+            prefix: Directory name prefix of this folder's indexes
+        """
+        for index_dir in keep.parent.glob(f"{prefix}*"):
+            if index_dir != keep and "." not in index_dir.name and index_dir.is_dir():
+                shutil.rmtree(index_dir, ignore_errors=True)
+    
+    def _index_prefix(self) -> str:
+        """
+        Directory name prefix of the saved indexes of this PDF folder.
+        
+        Returns:
+            ``bm25_<hash of the resolved folder path>_``
+        """
+        folder = str(Path(self.files_dir).resolve())
+        return f"bm25_{hashlib.sha256(folder.encode()).hexdigest()[:16]}_"
+    
+    def _has_sources(self) -> bool:
+        """Check whether the researcher has anything to retrieve from"""
+        return self.retriever is not None or self.use_wikipedia or self.use_arxiv
+    
+    @staticmethod
+    def _no_sources(state: ResearchState) -> ResearchState:
+        """Final state of a run with no retriever and no scrapers"""
+        topic = state.get("topic", "")
+        return {
+            "summary": NO_SOURCES_SUMMARY,
+            "critique_A": NO_SUMMARY_CRITIQUE,
+            "critique_B": NO_SUMMARY_CRITIQUE,
+            "insight": f"Insufficient evidence for topic '{topic}'. "
+                       f"Summary: {NO_SOURCES_SUMMARY}",
+            "sources": [],
+            "snippets": []
+        }
+    
+    @staticmethod
+    def _dispatch_reviewers(state: ResearchState) -> List[Send]:
+        """Send the researcher output to both reviewers in parallel"""
+        return [Send("reviewer_A", state), Send("reviewer_B", state)]
+    
+    def research(
+        self,
+        topic: str,
+        on_token: Optional[Callable[[str, str], None]] = None
+    ) -> ResearchState:
+        """
+        Run the research workflow on a topic.
+        
+        Synchronous wrapper around :meth:`aresearch`; when called from inside
+        a running event loop the run happens on a worker thread. Async
+        callers should await :meth:`aresearch` instead.
+        
+        Args:
+            topic: Research topic/query
+            on_token: Optional callback receiving (node name, text chunk) for
+                every LLM token as it is generated (e.g. print_token)
+        
+        Returns:
+            Final research state with all results
+        """
+        return run_sync(self.aresearch(topic, on_token))
     
-    def research(self, topic: str) -> ResearchState:
+    async def aresearch(
+        self,
+        topic: str,
+        on_token: Optional[Callable[[str, str], None]] = None
+    ) -> ResearchState:
         """
         Run the research workflow on a topic.
         
         Args:
             topic: Research topic/query
-            
+            on_token: Optional callback receiving (node name, text chunk) for
+                every LLM token as it is generated (e.g. print_token)
+        
         Returns:
             Final research state with all results
         """
@@ -156,17 +454,233 @@ class ResearchSystem:
                 "Research system not initialized. Call initialize() first."
             )
         
+        # Scanning the PDF folder (and re-indexing it if it changed) blocks,
+        # so it runs on a worker thread
+        await asyncio.to_thread(self._refresh_graph)
+        
         print(f"\n🔬 Running debate pipeline for: {topic}")
         print("   Researcher → Reviewers → Synthesizer\n")
         
-        result = self.app.invoke({"topic": topic})
+        # Each run gets its own checkpoint thread on the shared compiled graph,
+        # so concurrent research() calls never share graph state
+        thread_id = uuid4().hex
+        self.last_thread_id = thread_id
+        config = {"configurable": {"thread_id": thread_id}}
+        
+        try:
+            return await self._arun({"topic": topic}, config, on_token)
+        finally:
+            self._retain_checkpoints(thread_id)
+    
+    def _refresh_graph(self):
+        """
+        Pick up added/modified PDFs without re-tokenizing an unchanged
+        corpus, rebuilding the graph if sources appeared or vanished.
+        """
+        with self._lock:
+            if (
+                self._refresh_retriever()
+                and self._has_sources() != self._graph_has_sources
+            ):
+                # PDFs appeared or vanished: switch pipeline shape
+                self._build_graph()
+    
+    def _retain_checkpoints(self, thread_id: str):
+        """
+        Record a finished run and delete the checkpoints of the runs beyond
+        the Config.GRAPH_CHECKPOINT_RETAIN most recent ones, so the
+        checkpoint store does not grow with every query.
+        
+        Args:
+            thread_id: Checkpoint thread of the finished run
+        """
+        with self._lock:
+            self._retained_threads.append(thread_id)
+            expired = []
+            while len(self._retained_threads) > Config.GRAPH_CHECKPOINT_RETAIN:
+                expired.append(self._retained_threads.popleft())
+        
+        # close() may have released the checkpointer while the run finished
+        checkpointer = self.checkpointer
+        if checkpointer is None:
+            return
+        for old_thread_id in expired:
+            checkpointer.delete_thread(old_thread_id)
+    
+    async def _arun(
+        self,
+        inputs: ResearchState,
+        config: dict,
+        on_token: Optional[Callable[[str, str], None]] = None
+    ) -> ResearchState:
+        """
+        Run the compiled graph asynchronously.
+        
+        Args:
+            inputs: Initial graph state
+            config: Run configuration (checkpoint thread)
+            on_token: Optional streaming callback, see research()
+        
+        Returns:
+            Final research state
+        """
+        if on_token is None:
+            return await self.app.ainvoke(inputs, config=config)
+        
+        # Tokens of one node are passed on as they arrive. Nodes running in
+        # parallel with it (the reviewers, with Config.PARALLEL_REVIEWERS)
+        # are buffered and handed over once it finishes, so the output of
+        # every node stays contiguous.
+        live: Optional[str] = None
+        buffered: Dict[str, List[str]] = {}
+        finished = set()
+        
+        result = None
+        async for mode, payload in self.app.astream(
+            inputs,
+            config=config,
+            stream_mode=["messages", "updates", "values"]
+        ):
+            if mode == "messages":
+                chunk, metadata = payload
+                if not chunk.content:
+                    continue
+                node = metadata.get("langgraph_node", "")
+                if live is None:
+                    live = node
+                if node == live:
+                    on_token(node, chunk.content)
+                else:
+                    buffered.setdefault(node, []).append(chunk.content)
+            elif mode == "updates":
+                finished.update(payload)
+                if live in payload:
+                    live = None
+                    for node in list(buffered):
+                        on_token(node, "".join(buffered.pop(node)))
+                        if node not in finished:
+                            live = node
+                            break
+            else:
+                result = payload
+        
+        for node, tokens in buffered.items():
+            on_token(node, "".join(tokens))
+        
         return result
     
+    def prefetch(self):
+        """
+        Warm the LLM API connection while the user is typing.
+        
+        Opens (or keeps alive) the pooled connection so the next research()
+        call skips the TCP/TLS handshake. Errors are ignored.
+        """
+        try:
+            self.http_client.head(Config.LLM_API_BASE)
+        except httpx.HTTPError:
+            pass
+    
     @staticmethod
     def print_divider():
         """Print a visual divider"""
         print("\n" + "=" * 80 + "\n")
     
+    def print_token(self, node: str, token: str):
+        """
+        Print a streamed LLM token, with a header whenever the node changes.
+        
+        Args:
+            node: Graph node producing the token
+            token: Text chunk
+        """
+        self._streamed_nodes.add(node)
+        if node != self._streaming_node:
+            self._streaming_node = node
+            headers = {
+                "researcher": "📘 Researcher Summary:",
+                "reviewers": "🔍 Reviewer Critiques:",
+                "reviewer_A": "🔍 Reviewer A Critique:",
+                "reviewer_B": "🧐 Reviewer B Critique:",
+                "synthesizer": "💡 Collective Insight:"
+            }
+            self.print_divider()
+            print(headers.get(node, f"{node}:") + "\n")
+        
+        sys.stdout.write(token)
+        sys.stdout.flush()
+    
+    def display_unstreamed(self, result: ResearchState):
+        """
+        Display the result fields that were not streamed by print_token.
+        
+        Fields filled without an LLM call (no sources found, or a stage
+        skipped for lack of input) produce no tokens and would otherwise
+        never be shown.
+        
+        Args:
+            result: Research state with results
+        """
+        sections = [
+            ("summary", "📘 Researcher Summary:", {"researcher"}),
+            ("critique_A", "🔍 Reviewer A Critique:", {"reviewers", "reviewer_A"}),
+            ("critique_B", "🧐 Reviewer B Critique:", {"reviewers", "reviewer_B"}),
+            ("insight", "💡 Collective Insight:", {"synthesizer"})
+        ]
+        for field, header, nodes in sections:
+            if result.get(field) and not nodes & self._streamed_nodes:
+                self._streaming_node = None
+                self.print_divider()
+                print(header + "\n")
+                print(result[field])
+    
+    def display_sources(self, result: ResearchState):
+        """
+        Display the sources used for a research result.
+        
+        Args:
+            result: Research state with results
+        """
+        self._streaming_node = None
+        self._streamed_nodes.clear()
+        self.print_divider()
+        sources = result.get("sources", [])
+        print(f"📚 Sources used: {', '.join(sources) if sources else 'None'}")
+        
+        usage = self.get_token_usage()
+        if Config.VERBOSE and usage["prompt_tokens"]:
+            print(
+                f"🧮 Prompt tokens: {usage['prompt_tokens']} "
+                f"(cached: {usage['cached_tokens']})"
+            )
+        if Config.VERBOSE and Config.LLM_CACHE_ENABLED:
+            print(
+                f"🗄️  LLM cache: {self.llm_cache.hits} hits, "
+                f"{self.llm_cache.misses} misses"
+            )
+        self.print_divider()
+    
+    def get_token_usage(self) -> dict:
+        """
+        Get prompt token usage accumulated by all agents.
+        
+        Returns:
+            Dictionary with total prompt tokens and provider-cached tokens
+        """
+        agents = [
+            self.researcher,
+            self.reviewer_a,
+            self.reviewer_b,
+            self.combined_reviewer,
+            self.synthesizer
+        ]
+        usage = {"prompt_tokens": 0, "cached_tokens": 0}
+        for agent in agents:
+            if agent is not None:
+                for key in usage:
+                    usage[key] += agent.usage[key]
+        return usage
+    
     def display_results(self, result: ResearchState):
         """
         Display research results in a formatted way.
@@ -192,7 +706,4 @@ class ResearchSystem:
         print("💡 Collective Insight:\n")
         print(result.get("insight", "—"))
         
-        self.print_divider()
-        sources = result.get("sources", [])
-        print(f"📚 Sources used: {', '.join(sources) if sources else 'None'}")
-        self.print_divider()
+        self.display_sources(result)
@@ -2,8 +2,15 @@
 BM25-based document retriever
 """
 
-from typing import List
-from rank_bm25 import BM25Okapi
+import json
+import os
+import shutil
+from collections import Counter
+from pathlib import Path
+from typing import Dict, Iterable, List, Union
+
+import numpy as np
+from scipy.sparse import csc_matrix
 
 from .document_loader import DocChunk
 from ..utils.tokenizer import simple_tokenize
@@ -12,18 +19,184 @@ from ..utils.tokenizer import simple_tokenize
 class BM25Retriever:
     """BM25-based retriever for semantic document search"""
     
-    def __init__(self, chunks: List[DocChunk]):
+    def __init__(self, chunks: List[DocChunk], k1: float = 1.5, b: float = 0.75):
         """
         Initialize BM25 retriever with document chunks.
         
         Args:
             chunks: List of document chunks to index
+            k1: Term frequency saturation parameter
+            b: Document length normalization parameter
         """
         self.chunks = chunks
-        self.tokenized_texts = [
-            simple_tokenize(c.page_content) for c in chunks
-        ]
-        self.bm25 = BM25Okapi(self.tokenized_texts)
+        self.k1 = k1
+        self.b = b
+        # Tokens are consumed one chunk at a time, never held for the corpus
+        self._build_index(simple_tokenize(c.page_content) for c in chunks)
+    
+    def _build_index(self, tokenized_texts: Iterable[List[str]]):
+        """
+        Precompute the BM25 term weights of every (document, term) pair.
+        
+        The length-normalized term frequencies
+        tf * (k1 + 1) / (tf + k1 * (1 - b + b * |d| / avgdl))
+        are stored in a sparse (documents x vocabulary) matrix, so scoring a
+        query is a single sparse matrix-vector product.
+        
+        The weights lie in (0, k1 + 1) and are quantized to uint8 steps of
+        weight_scale, a quarter of the float32 size; the scale is folded
+        into the query weights at scoring time.
+        
+        Args:
+            tokenized_texts: Tokens of each document
+        """
+        self.vocab: Dict[str, int] = {}
+        rows: List[int] = []
+        cols: List[int] = []
+        tfs: List[int] = []
+        doc_len: List[int] = []
+        
+        for doc_id, tokens in enumerate(tokenized_texts):
+            counts = Counter(tokens)
+            doc_len.append(len(tokens))
+            rows.extend([doc_id] * len(counts))
+            for term, tf in counts.items():
+                cols.append(self.vocab.setdefault(term, len(self.vocab)))
+                tfs.append(tf)
+        
+        n_docs = len(doc_len)
+        rows_arr = np.asarray(rows, dtype=np.int32)
+        cols_arr = np.asarray(cols, dtype=np.int32)
+        tf_arr = np.asarray(tfs, dtype=np.float32)
+        self.doc_len = np.asarray(doc_len, dtype=np.float32)
+        self.avgdl = float(self.doc_len.mean()) if n_docs and self.doc_len.any() else 1.0
+        
+        denom = tf_arr + self.k1 * (
+            1 - self.b + self.b * self.doc_len[rows_arr] / self.avgdl
+        )
+        weights = tf_arr * (self.k1 + 1) / denom
+        
+        # Never round a present term down to 0, it would drop the entry
+        self.weight_scale = (self.k1 + 1) / 255
+        quantized = np.clip(np.rint(weights / self.weight_scale), 1, 255).astype(np.uint8)
+        
+        # CSC: a query only touches the columns of its own terms
+        self.term_weights = csc_matrix(
+            (quantized, (rows_arr, cols_arr)),
+            shape=(n_docs, len(self.vocab)),
+            dtype=np.uint8
+        )
+        
+        df = np.bincount(cols_arr, minlength=len(self.vocab))
+        self.idf = np.log(1 + (n_docs - df + 0.5) / (df + 0.5)).astype(np.float32)
+    
+    def save(self, path: Union[str, Path]):
+        """
+        Save the index to a directory.
+        
+        Arrays are written as .npy files so load() can memory-map them;
+        the vocabulary and chunks are stored as JSON. The directory is
+        written under a temporary name and renamed when complete.
+        
+        Args:
+            path: Target directory
+        """
+        path = Path(path)
+        tmp_path = path.with_name(f"{path.name}.tmp{os.getpid()}")
+        shutil.rmtree(tmp_path, ignore_errors=True)
+        tmp_path.mkdir(parents=True)
+        
+        arrays = {
+            "data": self.term_weights.data,
+            "indices": self.term_weights.indices,
+            "indptr": self.term_weights.indptr,
+            "idf": self.idf,
+            "doc_len": self.doc_len
+        }
+        for name, array in arrays.items():
+            np.save(tmp_path / f"{name}.npy", array)
+        
+        with open(tmp_path / "index.json", "w", encoding="utf-8") as f:
+            json.dump({
+                "k1": self.k1,
+                "b": self.b,
+                "avgdl": self.avgdl,
+                "weight_scale": self.weight_scale,
+                "shape": list(self.term_weights.shape),
+                "vocab": self.vocab
+            }, f)
+        
+        with open(tmp_path / "chunks.json", "w", encoding="utf-8") as f:
+            json.dump(
+                [{"page_content": c.page_content, "metadata": c.metadata} for c in self.chunks],
+                f
+            )
+        
+        shutil.rmtree(path, ignore_errors=True)
+        tmp_path.rename(path)
+    
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "BM25Retriever":
+        """
+        Load an index saved with save().
+        
+        Arrays are memory-mapped read-only, so nothing is re-tokenized and
+        pages are only read from disk when a query touches them.
+        
+        Args:
+            path: Directory written by save()
+            
+        Returns:
+            Retriever ready for queries
+        """
+        path = Path(path)
+        arrays = {
+            name: np.load(path / f"{name}.npy", mmap_mode="r")
+            for name in ("data", "indices", "indptr", "idf", "doc_len")
+        }
+        
+        with open(path / "index.json", encoding="utf-8") as f:
+            meta = json.load(f)
+        with open(path / "chunks.json", encoding="utf-8") as f:
+            chunks = [DocChunk(**c) for c in json.load(f)]
+        
+        retriever = cls.__new__(cls)
+        retriever.chunks = chunks
+        retriever.k1 = meta["k1"]
+        retriever.b = meta["b"]
+        retriever.avgdl = meta["avgdl"]
+        # Indexes saved before quantization store float32 weights
+        retriever.weight_scale = meta.get("weight_scale", 1.0)
+        retriever.vocab = meta["vocab"]
+        retriever.idf = arrays["idf"]
+        retriever.doc_len = arrays["doc_len"]
+        retriever.term_weights = csc_matrix(
+            (arrays["data"], arrays["indices"], arrays["indptr"]),
+            shape=tuple(meta["shape"])
+        )
+        return retriever
+    
+    def get_scores(self, q_tokens: List[str]) -> np.ndarray:
+        """
+        Compute the BM25 score of every document for a tokenized query.
+        
+        Args:
+            q_tokens: Query tokens (repeated tokens count repeatedly)
+        
+        Returns:
+            Array of one score per document
+        """
+        counts = Counter(
+            self.vocab[t] for t in q_tokens if t in self.vocab
+        )
+        if not counts:
+            return np.zeros(len(self.chunks), dtype=np.float32)
+        
+        term_ids = np.fromiter(counts.keys(), dtype=np.int32, count=len(counts))
+        query_weights = self.idf[term_ids] * np.fromiter(
+            counts.values(), dtype=np.float32, count=len(counts)
+        ) * np.float32(self.weight_scale)
+        return self.term_weights[:, term_ids] @ query_weights
     
     def get_relevant_documents(self, query: str, k: int = 3) -> List[DocChunk]:
         """
@@ -32,7 +205,7 @@ class BM25Retriever:
         Args:
             query: Search query
             k: Number of documents to retrieve
-            
+        
         Returns:
             List of most relevant document chunks
         """
@@ -41,14 +214,36 @@ class BM25Retriever:
         if not q_tokens:
             return []
         
-        scores = self.bm25.get_scores(q_tokens)
-        idx_scores = sorted(enumerate(scores), key=lambda x: x[1], reverse=True)
+        scores = self.get_scores(q_tokens)
+        
+        k = min(k, len(scores))
+        if k <= 0:
+            return []
         
-        # Get top-k indices with positive scores
-        top = [i for i, sc in idx_scores[:k] if sc > 0]
+        # Only k hits are needed: find the k-th best score with an O(N)
+        # partition instead of sorting all N scores, then order just those
+        # k. Ties at the cut-off go to the earliest documents, as with a
+        # stable descending sort.
+        if k < len(scores):
+            kth = np.partition(scores, len(scores) - k)[len(scores) - k]
+            above = np.flatnonzero(scores > kth)
+            ties = np.flatnonzero(scores == kth)[:k - above.size]
+            top = np.concatenate((above, ties))
+        else:
+            top = np.arange(len(scores))
+        top = top[np.lexsort((top, -scores[top]))]
         
-        # If no positive scores, get top-k anyway
-        if not top and len(idx_scores) > 0:
-            top = [i for i, _ in idx_scores[:k]]
+        # Keep top-k indices with positive scores; if there are none,
+        # return the top-k anyway
+        positive = top[scores[top] > 0]
+        if positive.size:
+            top = positive
         
         return [self.chunks[i] for i in top]
+    
+    def warmup(self):
+        """
+        Run a throwaway query so one-time costs (lazy imports, first
+        allocation of the score arrays) are paid before the first user query.
+        """
+        self.get_relevant_documents("warmup query", k=1)
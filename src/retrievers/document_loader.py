@@ -2,16 +2,24 @@
 Document loading and chunking utilities
 """
 
+import logging
+import multiprocessing
 import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from glob import glob
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Sequence
 from dataclasses import dataclass
 from pathlib import Path
 
-from langchain_community.document_loaders import PyPDFLoader
-from langchain_text_splitters import RecursiveCharacterTextSplitter
+from langchain_core.documents import Document
 
 from ..config import Config
+from ..utils.pdf_text import extract_pdf_pages, PDFIUM_AVAILABLE
+
+
+logger = logging.getLogger(__name__)
 
 
 @dataclass
@@ -21,6 +29,155 @@ class DocChunk:
     metadata: Dict[str, Any]
 
 
+# Preferred break points, coarsest first: paragraphs, lines, words
+_SEPARATORS = ("\n\n", "\n", " ")
+
+
+def _fast_split(
+    text: str,
+    size: int,
+    overlap: int,
+    separators: Sequence[str] = _SEPARATORS
+) -> List[str]:
+    """
+    Split text into chunks of at most size characters.
+    
+    Text is cut at the coarsest separator it contains; pieces that are
+    still too long are cut again at the next finer separator (or at fixed
+    offsets when none is left). Pieces are then packed greedily, repeating
+    up to overlap characters of trailing pieces at the start of the next
+    chunk.
+    
+    Args:
+        text: Text to split
+        size: Maximum chunk size in characters
+        overlap: Overlap between consecutive chunks in characters
+        separators: Break points to try, coarsest first
+    
+    Returns:
+        List of chunks
+    """
+    for i, sep in enumerate(separators):
+        if sep in text:
+            finer = separators[i + 1:]
+            break
+    else:
+        # No break point left: cut at fixed offsets
+        step = max(size - overlap, 1)
+        return [text[i:i + size] for i in range(0, len(text), step) if text[i:i + size].strip()]
+    
+    chunks: List[str] = []
+    pending: List[str] = []
+    for piece in text.split(sep):
+        if len(piece) < size:
+            pending.append(piece)
+            continue
+        if pending:
+            chunks.extend(_pack(pending, sep, size, overlap))
+            pending = []
+        chunks.extend(_fast_split(piece, size, overlap, finer))
+    if pending:
+        chunks.extend(_pack(pending, sep, size, overlap))
+    return chunks
+
+
+def _pack(pieces: List[str], sep: str, size: int, overlap: int) -> List[str]:
+    """
+    Greedily join short pieces into chunks of at most size characters.
+    
+    Args:
+        pieces: Pieces shorter than size
+        sep: Separator the pieces were split on
+        size: Maximum chunk size in characters
+        overlap: Overlap between consecutive chunks in characters
+    
+    Returns:
+        List of chunks
+    """
+    chunks: List[str] = []
+    window: deque = deque()
+    total = 0  # length of sep.join(window)
+    sep_len = len(sep)
+    
+    for piece in pieces:
+        added = len(piece) + (sep_len if window else 0)
+        if window and total + added > size:
+            chunk = sep.join(window).strip()
+            if chunk:
+                chunks.append(chunk)
+            # Keep at most overlap characters, and leave room for the piece
+            while window and (
+                total > overlap
+                or total + len(piece) + sep_len > size
+            ):
+                total -= len(window.popleft()) + (sep_len if window else 0)
+            added = len(piece) + (sep_len if window else 0)
+        window.append(piece)
+        total += added
+    
+    chunk = sep.join(window).strip()
+    if chunk:
+        chunks.append(chunk)
+    return chunks
+
+
+def _load_single_pdf(pdf_path: str, chunk_size: int, chunk_overlap: int) -> List[DocChunk]:
+    """
+    Load and chunk one PDF.
+    
+    Defined at module level so it can run in a worker process.
+    
+    Args:
+        pdf_path: Path to the PDF file
+        chunk_size: Size of text chunks in characters
+        chunk_overlap: Overlap between chunks in characters
+    
+    Returns:
+        List of document chunks with metadata (empty if the PDF fails to load)
+    """
+    filename = os.path.basename(pdf_path)
+    try:
+        if PDFIUM_AVAILABLE:
+            pages = extract_pdf_pages(pdf_path)
+            docs = [
+                Document(
+                    page_content=text,
+                    metadata={
+                        "source": pdf_path,
+                        "total_pages": len(pages),
+                        "page": i,
+                        "page_label": str(i + 1)
+                    }
+                )
+                for i, text in enumerate(pages)
+            ]
+        else:
+            # Only needed without pypdfium2; importing it pulls in all of
+            # langchain_community
+            from langchain_community.document_loaders import PyPDFLoader
+            loader = PyPDFLoader(pdf_path)
+            docs = loader.load()
+    except Exception as e:
+        logger.warning("⚠️  Failed to load %s: %s", pdf_path, e)
+        return []
+    
+    # Add metadata to each document
+    for i, d in enumerate(docs):
+        if not d.metadata:
+            d.metadata = {}
+        d.metadata["source"] = filename
+        d.metadata["orig_page_index"] = d.metadata.get("page", i)
+    
+    # Split each page into chunks, add chunk IDs and convert to DocChunk
+    chunks: List[DocChunk] = []
+    for d in docs:
+        for text in _fast_split(d.page_content, chunk_size, chunk_overlap):
+            meta = dict(d.metadata)
+            meta["chunk_id"] = f"{filename}__chunk{len(chunks)}"
+            chunks.append(DocChunk(page_content=text, metadata=meta))
+    return chunks
+
+
 class DocumentLoader:
     """Handles loading and chunking of PDF documents"""
     
@@ -38,18 +195,20 @@ class DocumentLoader:
         """
         self.chunk_size = chunk_size
         self.chunk_overlap = chunk_overlap
-        self.splitter = RecursiveCharacterTextSplitter(
-            chunk_size=chunk_size,
-            chunk_overlap=chunk_overlap
-        )
     
     def load_and_chunk_pdfs(self, files_dir: str) -> List[DocChunk]:
         """
         Load all PDFs from a directory and chunk them.
         
+        PDFs are parsed in parallel worker processes (text extraction is
+        CPU-bound); chunks keep the sorted file order. Workers are spawned
+        rather than forked: this runs on worker threads too, and a child
+        forked while another thread holds a lock (PDFium, logging) would
+        inherit it locked and deadlock.
+        
         Args:
             files_dir: Directory containing PDF files
-            
+        
         Returns:
             List of document chunks with metadata
         """
@@ -57,35 +216,32 @@ class DocumentLoader:
         pdf_paths = sorted(glob(os.path.join(files_dir, "*.pdf")))
         
         if not pdf_paths:
-            print(f"⚠️  No PDF files found in {files_dir}")
+            logger.warning("⚠️  No PDF files found in %s", files_dir)
             return chunks
         
-        for pdf_path in pdf_paths:
-            filename = os.path.basename(pdf_path)
+        sizes = [self.chunk_size] * len(pdf_paths)
+        overlaps = [self.chunk_overlap] * len(pdf_paths)
+        
+        if len(pdf_paths) == 1:
+            # Not worth starting a process pool for a single file
+            results = map(_load_single_pdf, pdf_paths, sizes, overlaps)
+            for pdf_chunks in results:
+                chunks.extend(pdf_chunks)
+        else:
+            workers = min(len(pdf_paths), os.cpu_count() or 1)
             try:
-                loader = PyPDFLoader(pdf_path)
-                docs = loader.load()
-            except Exception as e:
-                print(f"⚠️  Failed to load {pdf_path}: {e}")
-                continue
-            
-            # Add metadata to each document
-            for i, d in enumerate(docs):
-                if not d.metadata:
-                    d.metadata = {}
-                d.metadata["source"] = filename
-                d.metadata["orig_page_index"] = d.metadata.get("page", i)
-            
-            # Split documents into chunks
-            doc_chunks = self.splitter.split_documents(docs)
-            
-            # Add chunk IDs and convert to DocChunk
-            for idx, c in enumerate(doc_chunks):
-                meta = dict(c.metadata)
-                meta["chunk_id"] = f"{filename}__chunk{idx}"
-                chunks.append(
-                    DocChunk(page_content=c.page_content, metadata=meta)
-                )
+                with ProcessPoolExecutor(
+                    max_workers=workers,
+                    mp_context=multiprocessing.get_context("spawn")
+                ) as executor:
+                    results = list(executor.map(_load_single_pdf, pdf_paths, sizes, overlaps))
+            except BrokenProcessPool as e:
+                # Spawned workers re-import the __main__ module, which fails
+                # for scripts without an `if __name__ == "__main__":` guard
+                logger.warning("⚠️  PDF worker processes failed (%s), parsing sequentially", e)
+                results = list(map(_load_single_pdf, pdf_paths, sizes, overlaps))
+            for pdf_chunks in results:
+                chunks.extend(pdf_chunks)
         
-        print(f"📚 Loaded and chunked {len(chunks)} chunks from {len(pdf_paths)} PDF(s).")
+        logger.info("📚 Loaded and chunked %d chunks from %d PDF(s).", len(chunks), len(pdf_paths))
         return chunks
@@ -1,6 +1,25 @@
 """Web scraping modules"""
 
-from .wikipedia_scraper import WikipediaScraper
-from .arxiv_scraper import ArxivScraper
+from importlib import import_module
+
+# Scrapers are imported on first access (PEP 562) so that using one of them
+# does not load the other's dependencies
+_SCRAPER_MODULES = {
+    'WikipediaScraper': '.wikipedia_scraper',
+    'ArxivScraper': '.arxiv_scraper',
+}
 
 __all__ = ['WikipediaScraper', 'ArxivScraper']
+
+
+def __getattr__(name):
+    if name in _SCRAPER_MODULES:
+        module = import_module(_SCRAPER_MODULES[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -2,13 +2,22 @@
 ArXiv article scraper with PDF download capabilities
 """
 
+import asyncio
 import io
+import logging
 import os
-import requests
-from bs4 import BeautifulSoup
+import shutil
+from tempfile import SpooledTemporaryFile
+import feedparser
 from pathlib import Path
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import BinaryIO, List, Dict, Optional, Union
+
+from ..config import Config
+from ..utils.async_utils import run_sync
+from ..utils.http_cache import cached
+from ..utils.http_session import create_session
+from ..utils.pdf_text import extract_pdf_pages, PDFIUM_AVAILABLE
 
 try:
     from pypdf import PdfReader
@@ -19,29 +28,196 @@ except ImportError:
         PdfReader = None
 
 
+logger = logging.getLogger(__name__)
+
+
 class ArxivScraper:
     """Scraper for arXiv academic papers"""
     
-    def __init__(self):
-        """Initialize ArXiv scraper"""
+    # Downloads larger than this spill from memory to a temporary file
+    SPOOL_MAX_SIZE = 8 * 1024 * 1024
+    
+    def __init__(self, max_concurrency: int = Config.SCRAPER_MAX_CONCURRENCY):
+        """
+        Initialize ArXiv scraper.
+        
+        Args:
+            max_concurrency: Maximum number of PDFs downloaded at once
+        """
         self.api_url = "http://export.arxiv.org/api/query"
+        # Enough pooled connections for every concurrent PDF download
+        self.session = create_session(pool_size=max(10, max_concurrency))
+        self.max_concurrency = max_concurrency
+        self.pdf_cache_dir = Path(Config.CACHE_DIR) / "arxiv_pdfs"
     
-    @staticmethod
-    def extract_pdf_content(pdf_data: bytes) -> str:
+    async def _fetch(
+        self,
+        semaphore: asyncio.Semaphore,
+        url: str,
+        cache_path: Optional[Path] = None
+    ) -> BinaryIO:
+        """
+        Download one PDF, waiting for a free download slot.
+        
+        Args:
+            semaphore: Bounds the number of simultaneous downloads
+            url: PDF URL
+            cache_path: Optional local copy, read instead of downloading
+                when present and written after a successful download
+        
+        Returns:
+            Binary file positioned at the start of the PDF (caller closes it)
         """
-        Extract text content from PDF bytes.
+        if cache_path is not None and cache_path.exists():
+            try:
+                # Mark as recently used for _prune_pdf_cache
+                os.utime(cache_path)
+            except OSError:
+                pass
+            return open(cache_path, "rb")
+        
+        async with semaphore:
+            return await asyncio.to_thread(self._download, url, cache_path)
+    
+    def _download(self, url: str, cache_path: Optional[Path] = None) -> BinaryIO:
+        """
+        Download one PDF through the scraper's pooled, retrying session.
+        
+        The body is streamed into a SpooledTemporaryFile, so it is never
+        held as one bytes object and large PDFs spill to disk.
         
         Args:
-            pdf_data: PDF file content as bytes
+            url: PDF URL
+            cache_path: Optional local cache file, written after a
+                successful download
+        
+        Returns:
+            Binary file positioned at the start of the PDF (caller closes it)
+        """
+        pdf_file = SpooledTemporaryFile(max_size=self.SPOOL_MAX_SIZE)
+        try:
+            with self.session.get(url, stream=True, timeout=60) as response:
+                response.raise_for_status()
+                for chunk in response.iter_content(chunk_size=64 * 1024):
+                    pdf_file.write(chunk)
+            pdf_file.seek(0)
             
+            # Only keep real PDFs (arXiv may answer with an HTML placeholder)
+            if cache_path is not None and pdf_file.read(4) == b"%PDF":
+                pdf_file.seek(0)
+                try:
+                    cache_path.parent.mkdir(parents=True, exist_ok=True)
+                    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+                    with open(tmp_path, "wb") as f:
+                        shutil.copyfileobj(pdf_file, f)
+                    tmp_path.replace(cache_path)
+                    self._prune_pdf_cache(keep=cache_path)
+                except OSError as e:
+                    logger.warning("   ⚠️  Could not cache PDF: %s", e)
+            pdf_file.seek(0)
+        except BaseException:
+            pdf_file.close()
+            raise
+        
+        return pdf_file
+    
+    def _prune_pdf_cache(self, keep: Path):
+        """
+        Delete the least recently used cached PDFs while the cache exceeds
+        Config.ARXIV_PDF_CACHE_MAX_BYTES.
+        
+        Args:
+            keep: PDF that was just cached, never deleted
+        """
+        entries = []
+        for path in self.pdf_cache_dir.glob("*.pdf"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue  # deleted concurrently
+            entries.append((stat.st_mtime, stat.st_size, path))
+        
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= Config.ARXIV_PDF_CACHE_MAX_BYTES:
+                break
+            if path == keep:
+                continue
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            total -= size
+    
+    async def download_batch(
+        self,
+        urls: List[str],
+        cache_paths: Optional[List[Optional[Path]]] = None
+    ) -> List[Union[BinaryIO, Exception]]:
+        """
+        Download several PDFs concurrently.
+        
+        Args:
+            urls: PDF URLs
+            cache_paths: Optional local cache file for each URL
+        
+        Returns:
+            Binary file with the PDF (caller closes it) or the raised
+            exception for each URL, in order
+        """
+        if cache_paths is None:
+            cache_paths = [None] * len(urls)
+        
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        return await asyncio.gather(
+            *(
+                self._fetch(semaphore, url, cache_path)
+                for url, cache_path in zip(urls, cache_paths)
+            ),
+            return_exceptions=True
+        )
+    
+    def _query_feed(self, url: str) -> feedparser.FeedParserDict:
+        """
+        Fetch and parse an arXiv API Atom feed.
+        
+        Args:
+            url: API query URL
+        
+        Returns:
+            Parsed feed
+        """
+        response = self.session.get(url)
+        return feedparser.parse(response.content)
+    
+    @staticmethod
+    def extract_pdf_content(pdf_data: Union[bytes, BinaryIO]) -> str:
+        """
+        Extract text content from a PDF.
+        
+        Uses PDFium when pypdfium2 is installed (much faster than pypdf's
+        pure-Python parser), pypdf otherwise.
+        
+        Args:
+            pdf_data: PDF file content as bytes or a seekable binary file
+        
         Returns:
             Extracted text from the PDF
         """
+        if PDFIUM_AVAILABLE:
+            try:
+                full_text = "\n\n".join(
+                    text for text in extract_pdf_pages(pdf_data) if text
+                )
+                return full_text if full_text.strip() else "[No text could be extracted from PDF]"
+            except Exception as e:
+                return f"[Error extracting PDF content: {e}]"
+        
         if PdfReader is None:
             return "[PDF content extraction unavailable - pypdf not installed]"
         
         try:
-            pdf_file = io.BytesIO(pdf_data)
+            pdf_file = io.BytesIO(pdf_data) if isinstance(pdf_data, bytes) else pdf_data
             reader = PdfReader(pdf_file)
             
             text_content = []
@@ -51,7 +227,7 @@ class ArxivScraper:
                     if text:
                         text_content.append(text)
                 except Exception as e:
-                    print(f"   ⚠️  Could not extract text from page {page_num + 1}: {e}")
+                    logger.warning("   ⚠️  Could not extract text from page %d: %s", page_num + 1, e)
             
             full_text = "\n\n".join(text_content)
             return full_text if full_text.strip() else "[No text could be extracted from PDF]"
@@ -73,6 +249,44 @@ class ArxivScraper:
         """
         Scrape articles from arXiv based on keywords.
         
+        Synchronous wrapper around :meth:`ascrape_articles` (same arguments
+        and result), usable from inside a running event loop as well.
+        """
+        return run_sync(
+            self.ascrape_articles(
+                query=query,
+                max_results=max_results,
+                save_pdf=save_pdf,
+                extract_content=extract_content,
+                output_folder=output_folder,
+                start_date=start_date,
+                end_date=end_date,
+                sort_by=sort_by
+            )
+        )
+    
+    @cached(
+        ttl=Config.SCRAPER_CACHE_TTL,
+        cache_if=bool,
+        bypass=lambda args: args["save_pdf"]  # saving PDFs is a side effect
+    )
+    async def ascrape_articles(
+        self,
+        query: str = "ai for climate",
+        max_results: int = 5,
+        save_pdf: bool = False,
+        extract_content: bool = True,
+        output_folder: str = "pdfs",
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        sort_by: str = "relevance"
+    ) -> List[Dict]:
+        """
+        Scrape articles from arXiv based on keywords.
+        
+        The feed query and PDF text extraction run on worker threads, so the
+        event loop stays free for the downloads and other graph nodes.
+        
         Args:
             query: Search keywords
             max_results: Maximum number of papers to retrieve
@@ -82,7 +296,7 @@ class ArxivScraper:
             start_date: Filter papers from this date (YYYY-MM-DD)
             end_date: Filter papers until this date (YYYY-MM-DD)
             sort_by: Sort results by 'relevance', 'updated', or 'submitted'
-            
+        
         Returns:
             List of dictionaries containing article information
         """
@@ -103,47 +317,47 @@ class ArxivScraper:
             url += f"&sortBy={sort_options[sort_by]}&sortOrder=descending"
         
         # Query arXiv API
-        response = requests.get(url)
-        soup = BeautifulSoup(response.text, "xml")
+        feed = await asyncio.to_thread(self._query_feed, url)
         
-        entries = soup.find_all("entry")
-        print(f"📄 Found {len(entries)} papers for query: '{query}'")
+        entries = feed.entries
+        logger.info("📄 Found %d papers for query: '%s'", len(entries), query)
         
         articles = []
+        indices = []  # 1-based entry position of each article, for messages/filenames
+        
+        # Parse the date range once rather than for every entry
+        start = datetime.strptime(start_date, "%Y-%m-%d") if start_date else None
+        end = datetime.strptime(end_date, "%Y-%m-%d") if end_date else None
         
         for i, entry in enumerate(entries, 1):
             # Get paper details
-            title = entry.title.text.strip().replace('\n', ' ')
-            paper_id = entry.id.text.split('/')[-1]
+            title = entry.title.strip().replace('\n', ' ')
+            paper_id = entry.id.split('/')[-1]
             
             # Get publication date
-            published = entry.published.text
+            published = entry.published
             pub_date = datetime.strptime(published, "%Y-%m-%dT%H:%M:%SZ")
             
             # Filter by date range if specified
-            if start_date:
-                start = datetime.strptime(start_date, "%Y-%m-%d")
-                if pub_date < start:
-                    print(f"⏭️  Skipping (before {start_date}): {title[:60]}...")
-                    continue
+            if start and pub_date < start:
+                logger.debug("⏭️  Skipping (before %s): %.60s...", start_date, title)
+                continue
             
-            if end_date:
-                end = datetime.strptime(end_date, "%Y-%m-%d")
-                if pub_date > end:
-                    print(f"⏭️  Skipping (after {end_date}): {title[:60]}...")
-                    continue
+            if end and pub_date > end:
+                logger.debug("⏭️  Skipping (after %s): %.60s...", end_date, title)
+                continue
             
             # Construct PDF URL
             pdf_url = f"https://arxiv.org/pdf/{paper_id}.pdf"
             
             # Get abstract
-            abstract = entry.summary.text.strip().replace('\n', ' ') if entry.summary else ""
+            abstract = entry.get('summary', '').strip().replace('\n', ' ')
             
             # Get authors
             authors = [
-                author.find('name').text 
-                for author in entry.find_all('author')
-            ] if entry.find_all('author') else []
+                author.get('name', '')
+                for author in entry.get('authors', [])
+            ]
             
             article_data = {
                 "title": title,
@@ -156,57 +370,80 @@ class ArxivScraper:
                 "local_path": None
             }
             
-            # Download PDF if requested OR if content extraction is needed
-            pdf_data = None
-            if save_pdf or extract_content:
-                print(f"[{i}/{len(entries)}] Downloading: {title[:80]}...")
-                try:
-                    pdf_response = requests.get(pdf_url)
-                    pdf_response.raise_for_status()
-                    pdf_data = pdf_response.content
+            indices.append(i)
+            articles.append(article_data)
+        
+        # Download PDFs if requested OR if content extraction is needed;
+        # papers seen before are read from the local PDF cache
+        if save_pdf or extract_content:
+            downloads = await self.download_batch(
+                [a["pdf_url"] for a in articles],
+                [self.pdf_cache_dir / f"{a['arxiv_id']}.pdf" for a in articles]
+            )
+        else:
+            downloads = [None] * len(articles)
+        
+        for (i, article_data), pdf_data in zip(zip(indices, articles), downloads):
+            title = article_data["title"]
+            if pdf_data is None:
+                logger.debug("[%d/%d] %.80s...", i, len(entries), title)
+                continue
+            
+            logger.debug("[%d/%d] Downloading: %.80s...", i, len(entries), title)
+            if isinstance(pdf_data, Exception):
+                logger.warning("   ✗ Failed to download: %s", pdf_data)
+                continue
+            
+            try:
+                # Save to file if requested (copied from the download
+                # buffer without materializing it in memory)
+                if save_pdf:
+                    safe_title = "".join(
+                        c for c in title 
+                        if c.isalnum() or c in (' ', '-', '_')
+                    ).strip()
+                    safe_title = safe_title[:100]
+                    filename = f"{i}_{safe_title}.pdf"
+                    filepath = os.path.join(output_folder, filename)
                     
-                    # Save to file if requested
-                    if save_pdf:
-                        safe_title = "".join(
-                            c for c in title 
-                            if c.isalnum() or c in (' ', '-', '_')
-                        ).strip()
-                        safe_title = safe_title[:100]
-                        filename = f"{i}_{safe_title}.pdf"
-                        filepath = os.path.join(output_folder, filename)
-                        
+                    try:
                         with open(filepath, 'wb') as f:
-                            f.write(pdf_data)
-                        
-                        print(f"   ✓ Saved to: {filepath}")
+                            shutil.copyfileobj(pdf_data, f)
+                    except OSError as e:
+                        logger.warning("   ✗ Failed to save PDF: %s", e)
+                    else:
+                        logger.debug("   ✓ Saved to: %s", filepath)
                         article_data["local_path"] = filepath
-                    
-                    # Extract content if requested
-                    if extract_content and pdf_data:
-                        print(f"   📖 Extracting content...")
-                        content = self.extract_pdf_content(pdf_data)
+                    pdf_data.seek(0)
+                
+                # Extract content if requested
+                if extract_content:
+                    try:
+                        content = await asyncio.to_thread(self.extract_pdf_content, pdf_data)
+                    except Exception as e:
+                        logger.warning("   ✗ Failed to extract PDF content: %s", e)
+                    else:
                         article_data["content"] = content
-                        print(f"   ✓ Extracted {len(content)} characters")
-                        
-                except Exception as e:
-                    print(f"   ✗ Failed to download: {e}")
-            else:
-                print(f"[{i}/{len(entries)}] {title[:80]}...")
-            
-            articles.append(article_data)
+                        if content.startswith("["):
+                            # Parse errors come back as a bracketed message
+                            logger.warning("   ✗ %s", content)
+                        else:
+                            logger.debug("   ✓ Extracted %d characters", len(content))
+            finally:
+                pdf_data.close()
         
         if save_pdf:
             downloaded_count = sum(1 for a in articles if a.get("local_path"))
-            print(f"\n✅ {downloaded_count}/{len(articles)} PDFs downloaded successfully!")
+            logger.info("✅ %d/%d PDFs downloaded successfully!", downloaded_count, len(articles))
         
         if extract_content:
             extracted_count = sum(
                 1 for a in articles 
                 if a.get("content") and not a.get("content", "").startswith("[")
             )
-            print(f"✅ Extracted content from {extracted_count}/{len(articles)} articles")
+            logger.info("✅ Extracted content from %d/%d articles", extracted_count, len(articles))
         
         if not save_pdf and not extract_content:
-            print(f"\n✅ {len(articles)} articles retrieved successfully!")
+            logger.info("✅ %d articles retrieved successfully!", len(articles))
         
         return articles
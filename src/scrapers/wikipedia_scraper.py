@@ -2,26 +2,58 @@
 Wikipedia article scraper
 """
 
-import time
+import asyncio
+import logging
 import requests
-from bs4 import BeautifulSoup
+from lxml import etree, html as lxml_html
 from typing import List, Dict, Tuple, Optional
 
+from ..config import Config
+from ..utils.async_utils import run_sync
+from ..utils.http_cache import cached
+from ..utils.http_session import create_session
 from ..utils.text_utils import clean_query_for_wiki
 
 
+logger = logging.getLogger(__name__)
+
+
+# Boilerplate inside the article body: infoboxes, navigation boxes,
+# citation markers and "[edit]" links
+_UNWANTED = (
+    "ancestor-or-self::*[self::table or self::div or self::sup or self::span]"
+    "[contains(concat(' ', normalize-space(@class), ' '), ' infobox ')"
+    " or contains(concat(' ', normalize-space(@class), ' '), ' navbox ')"
+    " or contains(concat(' ', normalize-space(@class), ' '), ' reference ')"
+    " or contains(concat(' ', normalize-space(@class), ' '), ' mw-editsection ')]"
+)
+
+# Compiled once: article paragraphs outside boilerplate, and their text
+# nodes outside boilerplate (skips the citation markers inside a paragraph)
+_PARAGRAPHS_XPATH = etree.XPath(f".//p[not({_UNWANTED})]")
+_TEXT_XPATH = etree.XPath(f".//text()[not({_UNWANTED})]")
+
+
 class WikipediaScraper:
     """Scraper for Wikipedia articles"""
     
-    def __init__(self, user_agent: str = "WikipediaScraperBot/1.0"):
+    def __init__(
+        self,
+        user_agent: str = "WikipediaScraperBot/1.0",
+        max_concurrency: int = Config.SCRAPER_MAX_CONCURRENCY
+    ):
         """
         Initialize Wikipedia scraper.
         
         Args:
             user_agent: User agent string for requests
+            max_concurrency: Maximum number of articles fetched at once
         """
         self.headers = {'User-Agent': user_agent}
+        # Enough pooled connections for every concurrent article download
+        self.session = create_session(self.headers, pool_size=max(10, max_concurrency))
         self.search_url = "https://en.wikipedia.org/w/api.php"
+        self.max_concurrency = max_concurrency
     
     def search(self, query: str, limit: int = 10) -> List[Tuple[str, str]]:
         """
@@ -31,7 +63,7 @@ class WikipediaScraper:
         Args:
             query: Search query
             limit: Maximum number of results
-            
+        
         Returns:
             List of tuples (title, url) for relevant articles
         """
@@ -49,10 +81,9 @@ class WikipediaScraper:
         }
         
         try:
-            response = requests.get(
+            response = self.session.get(
                 self.search_url,
                 params=params,
-                headers=self.headers,
                 timeout=10
             )
             response.raise_for_status()
@@ -90,7 +121,7 @@ class WikipediaScraper:
             return relevant_results[:limit]
         
         except requests.exceptions.RequestException as e:
-            print(f"❌ Error searching Wikipedia: {e}")
+            logger.warning("❌ Error searching Wikipedia: %s", e)
             return []
     
     def scrape_article(self, url: str) -> Optional[Tuple[str, str]]:
@@ -99,47 +130,90 @@ class WikipediaScraper:
         
         Args:
             url: Article URL
-            
+        
         Returns:
             Tuple of (title, content) or None if failed
         """
         try:
-            response = requests.get(url, headers=self.headers, timeout=10)
+            response = self.session.get(url, timeout=10)
             response.raise_for_status()
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # Get title
-            title_elem = soup.find('h1', {'id': 'firstHeading'})
-            if not title_elem:
-                return None
-            title = title_elem.text
-            
-            # Get main content
-            content_div = soup.find('div', {'id': 'mw-content-text'})
-            if not content_div:
-                return title, ""
-            
-            # Remove unwanted elements
-            for unwanted in content_div.find_all(
-                ['table', 'div', 'sup', 'span'],
-                {'class': ['infobox', 'navbox', 'reference', 'mw-editsection']}
-            ):
-                unwanted.decompose()
-            
-            # Extract paragraphs
-            paragraphs = content_div.find_all('p')
-            text = '\n\n'.join([
-                p.get_text().strip() 
-                for p in paragraphs 
-                if p.get_text().strip()
-            ])
-            
-            return title, text
+            return self._parse_article(response.text)
         
         except Exception as e:
-            print(f"   ❌ Error scraping article: {e}")
+            logger.warning("   ❌ Error scraping article: %s", e)
             return None
     
+    async def _fetch(
+        self,
+        semaphore: asyncio.Semaphore,
+        url: str
+    ) -> Optional[Tuple[str, str]]:
+        """
+        Fetch and parse one article, waiting for a free download slot.
+        
+        The request goes through the scraper's pooled, retrying session on
+        a worker thread.
+        
+        Args:
+            semaphore: Bounds the number of simultaneous downloads
+            url: Article URL
+        
+        Returns:
+            Tuple of (title, content) or None if failed
+        """
+        async with semaphore:
+            return await asyncio.to_thread(self.scrape_article, url)
+    
+    async def scrape_batch(self, urls: List[str]) -> List[Optional[Tuple[str, str]]]:
+        """
+        Fetch and parse several articles concurrently.
+        
+        At most max_concurrency requests are in flight at once, which keeps
+        the load on Wikipedia's servers bounded.
+        
+        Args:
+            urls: Article URLs
+        
+        Returns:
+            List of (title, content) tuples or None, in the order of urls
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        return await asyncio.gather(
+            *(self._fetch(semaphore, url) for url in urls)
+        )
+    
+    def _parse_article(self, html: str) -> Optional[Tuple[str, str]]:
+        """
+        Extract the title and paragraph text of an article page.
+        
+        Args:
+            html: Article HTML
+        
+        Returns:
+            Tuple of (title, content) or None if the page has no title
+        """
+        tree = lxml_html.fromstring(html)
+        
+        # Get title
+        title_elems = tree.xpath("//h1[@id='firstHeading']")
+        if not title_elems:
+            return None
+        title = title_elems[0].text_content()
+        
+        # Get main content
+        content_divs = tree.xpath("//div[@id='mw-content-text']")
+        if not content_divs:
+            return title, ""
+        
+        # Extract paragraphs, leaving out boilerplate without mutating the tree
+        paragraphs = (
+            ''.join(_TEXT_XPATH(p)).strip()
+            for p in _PARAGRAPHS_XPATH(content_divs[0])
+        )
+        text = '\n\n'.join(p for p in paragraphs if p)
+        
+        return title, text
+    
     def is_content_relevant(self, content: str, keywords: str, min_relevance: float = 0.2) -> bool:
         """
         Check if article content is relevant to search keywords.
@@ -155,7 +229,7 @@ class WikipediaScraper:
         word_count = len(content_lower.split())
         if word_count == 0:
             return False
-            
+        
         relevance = term_counts / word_count
         return relevance >= min_relevance
     
@@ -166,12 +240,36 @@ class WikipediaScraper:
     ) -> Dict[str, any]:
         """
         Search and scrape Wikipedia articles by keywords.
+        
+        Synchronous wrapper around :meth:`ascrape_by_keywords`, usable from
+        inside a running event loop as well.
+        
+        Args:
+            keywords: Search keywords
+            max_articles: Maximum number of articles to scrape
+        
+        Returns:
+            Same dictionary as :meth:`ascrape_by_keywords`
+        """
+        return run_sync(self.ascrape_by_keywords(keywords, max_articles))
+    
+    @cached(
+        ttl=Config.SCRAPER_CACHE_TTL,
+        cache_if=lambda result: bool(result.get('articles'))
+    )
+    async def ascrape_by_keywords(
+        self,
+        keywords: str,
+        max_articles: int = 5
+    ) -> Dict[str, any]:
+        """
+        Search and scrape Wikipedia articles by keywords.
         Includes relevance filtering for both titles and content.
         
         Args:
             keywords: Search keywords
             max_articles: Maximum number of articles to scrape
-            
+        
         Returns:
             Dictionary containing:
             - articles: List of article dictionaries with title, content, and url
@@ -180,18 +278,18 @@ class WikipediaScraper:
         """
         # Clean and enhance query
         cleaned_keywords = clean_query_for_wiki(keywords)
-        print(f"🔍 Searching Wikipedia for: '{cleaned_keywords}'")
+        logger.info("🔍 Searching Wikipedia for: '%s'", cleaned_keywords)
         
         # Try specific search first
         specific_query = f'"{cleaned_keywords}"'  # Exact phrase match
-        results = self.search(specific_query)
+        results = await asyncio.to_thread(self.search, specific_query)
         
         if not results:
-            print("⚠️  No exact matches found, trying general search...")
+            logger.info("⚠️  No exact matches found, trying general search...")
             # Try general search as fallback
-            results = self.search(cleaned_keywords)
+            results = await asyncio.to_thread(self.search, cleaned_keywords)
             if not results:
-                print("⚠️  No Wikipedia articles found at all")
+                logger.warning("⚠️  No Wikipedia articles found at all")
                 return {
                     'articles': [],
                     'is_fallback': False,
@@ -200,27 +298,28 @@ class WikipediaScraper:
         
         is_fallback = not specific_query  # True if we're using general search
         scraped_articles = []
-        attempted = 0
         max_attempts = max_articles * 2  # Allow some failures while seeking relevant content
         
-        for title, url in results:
-            if len(scraped_articles) >= max_articles or attempted >= max_attempts:
+        # Fetch every candidate at once, then check them in search order
+        candidates = results[:max_attempts]
+        pages = await self.scrape_batch([url for _, url in candidates])
+        
+        for (title, url), result in zip(candidates, pages):
+            if len(scraped_articles) >= max_articles:
                 break
-                
-            attempted += 1
-            print(f"[{len(scraped_articles) + 1}/{max_articles}] Checking: {title}")
             
-            result = self.scrape_article(url)
+            logger.debug("[%d/%d] Checking: %s", len(scraped_articles) + 1, max_articles, title)
+            
             if not result:
-                print("   ✗ Failed to scrape article")
+                logger.debug("   ✗ Failed to scrape article")
                 continue
-                
+            
             article_title, content = result
             
             # Check content relevance - be more lenient with fallback results
             relevance_threshold = 0.1 if is_fallback else 0.2
             if not self.is_content_relevant(content, cleaned_keywords, relevance_threshold):
-                print("   ↷ Article content not relevant - skipping")
+                logger.debug("   ↷ Article content not relevant - skipping")
                 continue
             
             scraped_articles.append({
@@ -228,13 +327,10 @@ class WikipediaScraper:
                 'content': content,
                 'url': url
             })
-            print("   ✓ Article scraped and verified relevant")
-            
-            # Be nice to Wikipedia servers
-            time.sleep(1)
+            logger.debug("   ✓ Article scraped and verified relevant")
         
         if not scraped_articles:
-            print("⚠️  No articles passed relevance checks")
+            logger.warning("⚠️  No articles passed relevance checks")
             return {
                 'articles': [],
                 'is_fallback': False,
@@ -250,7 +346,7 @@ class WikipediaScraper:
         else:
             message = f"Found {len(scraped_articles)} directly relevant articles."
         
-        print(f"✅ {message}")
+        logger.info("✅ %s", message)
         
         return {
             'articles': scraped_articles,
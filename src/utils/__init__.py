@@ -1,6 +1,37 @@
 """Utility functions for the research assistant"""
 
-from .tokenizer import simple_tokenize
-from .text_utils import truncate_text, clean_query_for_wiki
+from importlib import import_module
 
-__all__ = ['simple_tokenize', 'truncate_text', 'clean_query_for_wiki']
+# Utilities are imported on first access (PEP 562) so that importing a
+# light helper (e.g. the tokenizer) does not load langchain, langgraph or
+# PDFium through the other modules
+_UTIL_MODULES = {
+    'simple_tokenize': '.tokenizer',
+    'truncate_text': '.text_utils',
+    'clean_query_for_wiki': '.text_utils',
+    'cached': '.http_cache',
+    'run_sync': '.async_utils',
+    'LLMCache': '.llm_cache',
+    'extract_pdf_pages': '.pdf_text',
+    'PDFIUM_AVAILABLE': '.pdf_text',
+    'AsyncSqliteSaver': '.checkpoint',
+    'SQLITE_CHECKPOINT_AVAILABLE': '.checkpoint',
+}
+
+__all__ = [
+    'simple_tokenize', 'truncate_text', 'clean_query_for_wiki', 'cached', 'run_sync', 'LLMCache',
+    'extract_pdf_pages', 'PDFIUM_AVAILABLE', 'AsyncSqliteSaver', 'SQLITE_CHECKPOINT_AVAILABLE'
+]
+
+
+def __getattr__(name):
+    if name in _UTIL_MODULES:
+        module = import_module(_UTIL_MODULES[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
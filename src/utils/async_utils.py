@@ -0,0 +1,35 @@
+"""
+Helpers for calling coroutines from synchronous code
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Coroutine, TypeVar
+
+
+T = TypeVar("T")
+
+
+def run_sync(coro: Coroutine[Any, Any, T]) -> T:
+    """
+    Run a coroutine to completion and return its result.
+    
+    asyncio.run() refuses to start while an event loop is running in the
+    calling thread (a notebook, an async web handler, a LangGraph node), so
+    in that case the coroutine gets its own loop on a worker thread and the
+    caller blocks until it finishes. Async callers should await the
+    coroutine directly instead.
+    
+    Args:
+        coro: Coroutine to run
+    
+    Returns:
+        The coroutine's result
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coro).result()
@@ -0,0 +1,42 @@
+"""
+SQLite-backed LangGraph checkpointer usable from async graph runs
+"""
+
+try:
+    from langgraph.checkpoint.sqlite import SqliteSaver
+except ImportError:
+    SqliteSaver = None
+
+
+# True when langgraph-checkpoint-sqlite is installed; callers fall back to
+# an in-memory checkpointer otherwise
+SQLITE_CHECKPOINT_AVAILABLE = SqliteSaver is not None
+
+
+if SQLITE_CHECKPOINT_AVAILABLE:
+    class AsyncSqliteSaver(SqliteSaver):
+        """
+        SqliteSaver usable from ainvoke/astream.
+        
+        The stock class only implements the sync API. Checkpoint reads and
+        writes are small local sqlite operations (serialized by the saver's
+        own lock), so the async methods simply call the sync ones.
+        """
+        
+        async def aget_tuple(self, config):
+            return self.get_tuple(config)
+        
+        async def alist(self, config, *, filter=None, before=None, limit=None):
+            for item in self.list(config, filter=filter, before=before, limit=limit):
+                yield item
+        
+        async def aput(self, config, checkpoint, metadata, new_versions):
+            return self.put(config, checkpoint, metadata, new_versions)
+        
+        async def aput_writes(self, config, writes, task_id, task_path=""):
+            return self.put_writes(config, writes, task_id, task_path)
+        
+        async def adelete_thread(self, thread_id):
+            return self.delete_thread(thread_id)
+else:
+    AsyncSqliteSaver = None
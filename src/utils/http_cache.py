@@ -0,0 +1,196 @@
+"""
+Disk-backed memoization for slow network calls
+"""
+
+import hashlib
+import inspect
+import pickle
+import sqlite3
+import threading
+import time
+from functools import wraps
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from ..config import Config
+
+
+class SqliteCache:
+    """Key/value store of pickled values with per-entry expiry"""
+    
+    def __init__(self, path: Path):
+        """
+        Initialize sqlite cache.
+        
+        Args:
+            path: Database file (created on first use)
+        """
+        self.path = Path(path)
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+    
+    def _connect(self) -> sqlite3.Connection:
+        """
+        Open the database on first use, creating the table and dropping
+        entries that expired since the last run
+        """
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache ("
+                "key TEXT PRIMARY KEY, value BLOB NOT NULL, expires REAL NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS cache_expires ON cache (expires)"
+            )
+            self._conn.execute("DELETE FROM cache WHERE expires < ?", (time.time(),))
+            self._conn.commit()
+        return self._conn
+    
+    def get(self, key: str) -> Tuple[bool, Any]:
+        """
+        Look up a key.
+        
+        Args:
+            key: Cache key
+        
+        Returns:
+            Tuple of (hit, value); value is None on a miss or expired entry
+        """
+        with self._lock:
+            row = self._connect().execute(
+                "SELECT value, expires FROM cache WHERE key = ?", (key,)
+            ).fetchone()
+        
+        if row is None or row[1] < time.time():
+            return False, None
+        return True, pickle.loads(row[0])
+    
+    def set(self, key: str, value: Any, ttl: float):
+        """
+        Store a value.
+        
+        Args:
+            key: Cache key
+            value: Picklable value
+            ttl: Time to live in seconds
+        """
+        blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            # Expired entries are never read again; drop them as we go so
+            # a long-running process does not grow the file (indexed, cheap)
+            conn.execute("DELETE FROM cache WHERE expires < ?", (now,))
+            conn.execute(
+                "INSERT OR REPLACE INTO cache (key, value, expires) VALUES (?, ?, ?)",
+                (key, blob, now + ttl)
+            )
+            conn.commit()
+    
+    def clear(self):
+        """Delete every entry"""
+        with self._lock:
+            conn = self._connect()
+            conn.execute("DELETE FROM cache")
+            conn.commit()
+    
+    def close(self):
+        """Close the database connection (reopened on next use)"""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+_default_cache: Optional[SqliteCache] = None
+
+
+def get_default_cache() -> SqliteCache:
+    """Return the shared cache stored under Config.CACHE_DIR"""
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = SqliteCache(Config.CACHE_DIR / "http_cache.sqlite3")
+    return _default_cache
+
+
+def cached(
+    ttl: float = 86400,
+    cache_if: Optional[Callable[[Any], bool]] = None,
+    bypass: Optional[Callable[[Dict[str, Any]], bool]] = None
+):
+    """
+    Memoize a function or method on disk.
+    
+    The key is a sha256 of the function's qualified name and its bound
+    arguments (defaults applied, ``self`` excluded), so positional and
+    keyword calls with the same values share an entry. Coroutine functions
+    are supported; their awaited result is what gets stored.
+    
+    Args:
+        ttl: Time to live of an entry in seconds
+        cache_if: Predicate on the result; results failing it are not stored
+            (e.g. empty results caused by a network error)
+        bypass: Predicate on the bound arguments; matching calls skip the
+            cache entirely (e.g. calls with side effects)
+    
+    Returns:
+        Decorator
+    """
+    def decorator(func: Callable) -> Callable:
+        signature = inspect.signature(func)
+        
+        def make_key(args, kwargs) -> Optional[str]:
+            """Cache key of a call, or None when the call bypasses the cache"""
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            arguments = {k: v for k, v in bound.arguments.items() if k != "self"}
+            
+            if bypass and bypass(arguments):
+                return None
+            
+            return hashlib.sha256(
+                repr((func.__module__, func.__qualname__, sorted(arguments.items()))).encode()
+            ).hexdigest()
+        
+        if inspect.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                key = make_key(args, kwargs)
+                if key is None:
+                    return await func(*args, **kwargs)
+                
+                # Lookups are single-row reads of a local database, cheap
+                # enough to run on the event loop
+                cache = get_default_cache()
+                hit, value = cache.get(key)
+                if hit:
+                    return value
+                
+                value = await func(*args, **kwargs)
+                if cache_if is None or cache_if(value):
+                    cache.set(key, value, ttl)
+                return value
+            
+            return async_wrapper
+        
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            key = make_key(args, kwargs)
+            if key is None:
+                return func(*args, **kwargs)
+            
+            cache = get_default_cache()
+            hit, value = cache.get(key)
+            if hit:
+                return value
+            
+            value = func(*args, **kwargs)
+            if cache_if is None or cache_if(value):
+                cache.set(key, value, ttl)
+            return value
+        
+        return wrapper
+    
+    return decorator
@@ -0,0 +1,50 @@
+"""
+Shared HTTP session setup for the scrapers
+"""
+
+from typing import Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+
+
+def create_session(
+    headers: Optional[Dict[str, str]] = None,
+    retries: int = 3,
+    pool_size: int = 10
+) -> requests.Session:
+    """
+    Create a requests session with keep-alive connection pooling and
+    retries on transient errors.
+    
+    Reusing one session per scraper keeps TCP/TLS connections open between
+    requests instead of paying a new handshake for every call.
+    
+    Args:
+        headers: Default headers sent with every request
+        retries: Retries on connection errors and 429/5xx responses
+        pool_size: Connections kept open per host
+    
+    Returns:
+        Configured session
+    """
+    session = requests.Session()
+    if headers:
+        session.headers.update(headers)
+    
+    retry = Retry(
+        total=retries,
+        backoff_factor=0.5,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=("GET", "HEAD"),
+        raise_on_status=False  # hand the last response back to the caller
+    )
+    adapter = HTTPAdapter(
+        max_retries=retry,
+        pool_connections=pool_size,
+        pool_maxsize=pool_size
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
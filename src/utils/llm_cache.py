@@ -0,0 +1,129 @@
+"""
+Response cache for deterministic language model calls
+"""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Optional, Tuple
+
+from langchain_core.caches import BaseCache, RETURN_VAL_TYPE
+
+from .http_cache import SqliteCache
+
+
+class LLMCache(BaseCache):
+    """
+    In-memory LRU cache of model responses with per-entry expiry,
+    optionally backed by a sqlite file so entries survive restarts.
+    
+    Plugged into a chat model through its ``cache`` field, so cache hits
+    skip the API round trip while still reporting the response to
+    callbacks (e.g. LangGraph token streaming).
+    """
+    
+    def __init__(
+        self,
+        max_size: int = 256,
+        ttl: float = 86400,
+        path: Optional[Path] = None
+    ):
+        """
+        Initialize LLM cache.
+        
+        Args:
+            max_size: Maximum number of responses kept in memory
+            ttl: Time to live of an entry in seconds
+            path: Optional sqlite file for persistent storage
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self.disk = SqliteCache(path) if path else None
+        self.hits = 0
+        self.misses = 0
+        self._memory: "OrderedDict[str, Tuple[float, RETURN_VAL_TYPE]]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def _key(prompt: str, llm_string: str) -> str:
+        """
+        Compute the cache key.
+        
+        Args:
+            prompt: Serialized input messages
+            llm_string: Serialized model parameters (model name, temperature, ...)
+        
+        Returns:
+            Hex digest identifying the request
+        """
+        return hashlib.sha256(f"{llm_string}\n{prompt}".encode()).hexdigest()
+    
+    def lookup(self, prompt: str, llm_string: str) -> Optional[RETURN_VAL_TYPE]:
+        """
+        Look up a cached response.
+        
+        Args:
+            prompt: Serialized input messages
+            llm_string: Serialized model parameters
+        
+        Returns:
+            Cached generations, or None on a miss
+        """
+        key = self._key(prompt, llm_string)
+        
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None and entry[0] >= time.time():
+                self._memory.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+        
+        if self.disk is not None:
+            hit, value = self.disk.get(key)
+            if hit:
+                self._remember(key, value)
+                with self._lock:
+                    self.hits += 1
+                return value
+        
+        with self._lock:
+            self.misses += 1
+        return None
+    
+    def update(self, prompt: str, llm_string: str, return_val: RETURN_VAL_TYPE):
+        """
+        Store a response.
+        
+        Args:
+            prompt: Serialized input messages
+            llm_string: Serialized model parameters
+            return_val: Generations returned by the model
+        """
+        key = self._key(prompt, llm_string)
+        self._remember(key, return_val)
+        if self.disk is not None:
+            self.disk.set(key, return_val, self.ttl)
+    
+    def _remember(self, key: str, value: Any):
+        """Insert an entry in memory, evicting the least recently used one"""
+        with self._lock:
+            self._memory[key] = (time.time() + self.ttl, value)
+            self._memory.move_to_end(key)
+            if len(self._memory) > self.max_size:
+                self._memory.popitem(last=False)
+    
+    def clear(self, **kwargs: Any):
+        """Drop all entries, in memory and on disk, and reset the statistics"""
+        with self._lock:
+            self._memory.clear()
+            self.hits = 0
+            self.misses = 0
+        if self.disk is not None:
+            self.disk.clear()
+    
+    def close(self):
+        """Close the sqlite store, if any"""
+        if self.disk is not None:
+            self.disk.close()
@@ -0,0 +1,52 @@
+"""
+Fast PDF text extraction backed by PDFium
+"""
+
+import threading
+from pathlib import Path
+from typing import BinaryIO, List, Union
+
+try:
+    import pypdfium2 as pdfium
+except ImportError:
+    pdfium = None
+
+
+# True when pypdfium2 is installed; callers fall back to pypdf otherwise
+PDFIUM_AVAILABLE = pdfium is not None
+
+# PDFium is not thread-safe: one document is processed at a time per process
+_PDFIUM_LOCK = threading.Lock()
+
+
+def extract_pdf_pages(source: Union[str, Path, bytes, BinaryIO]) -> List[str]:
+    """
+    Extract the text of every page of a PDF.
+    
+    Args:
+        source: Path to a PDF file, the PDF content as bytes, or a seekable
+            binary file object (read from its current position)
+    
+    Returns:
+        List of page texts, in page order
+    """
+    if pdfium is None:
+        raise ImportError("pypdfium2 is not installed")
+    
+    if isinstance(source, Path):
+        source = str(source)
+    
+    pages: List[str] = []
+    with _PDFIUM_LOCK:
+        pdf = pdfium.PdfDocument(source)
+        try:
+            for page in pdf:
+                textpage = page.get_textpage()
+                pages.append(textpage.get_text_range())
+                textpage.close()
+                page.close()
+        finally:
+            pdf.close()
+    
+    # PDFium separates lines with CRLF
+    return [text.replace("\r\n", "\n") for text in pages]
@@ -3,9 +3,44 @@ Text processing utilities
 """
 
 import re
+from functools import lru_cache
 from typing import List
 
 
+# Compiled once at import instead of looked up in re's cache on every call
+_PUNCT_RE = re.compile(r"[^\w\s]")
+
+# Lowercases ASCII letters and deletes every ASCII character _PUNCT_RE
+# matches, so one str.translate pass does lower() + the regex
+_ASCII_LOWER_STRIP = {
+    ord(c): c.lower() if c.isalnum() or c == "_" or c.isspace() else None
+    for c in map(chr, range(128))
+}
+
+# AI/tech term mappings
+_AI_TERMS = {
+    'ia': 'artificial intelligence',
+    'ai': 'artificial intelligence',
+    'ml': 'machine learning',
+    'dl': 'deep learning',
+    'nlp': 'natural language processing'
+}
+
+# Domain-specific context terms
+_DOMAIN_CONTEXTS = {
+    'ecology': ['environmental', 'ecosystem', 'biological'],
+    'climate': ['environmental', 'weather', 'atmospheric'],
+    'health': ['medical', 'healthcare', 'clinical'],
+    'economy': ['economic', 'financial', 'market']
+}
+
+# Careful stopword selection (keep important modifiers)
+_STOPWORDS = frozenset({
+    'what', 'about', 'how', 'the', 'a', 'an', 'and',
+    'to', 'of', 'for', 'with', 'by'
+})
+
+
 def truncate_text(text: str, max_length: int = 800) -> str:
     """
     Truncate text to a maximum length, breaking at word boundaries.
@@ -20,10 +55,15 @@ def truncate_text(text: str, max_length: int = 800) -> str:
     if len(text) <= max_length:
         return text
     
-    truncated = text[:max_length].rsplit(" ", 1)[0]
-    return truncated + " ..."
+    # Find the last space in place instead of slicing and splitting a copy
+    cut = text.rfind(" ", 0, max_length)
+    if cut == -1:
+        cut = max_length
+    return text[:cut] + " ..."
 
 
+# Pure function of the query, and the same topics are searched repeatedly
+@lru_cache(maxsize=1024)
 def clean_query_for_wiki(query: str) -> str:
     """
     Clean and enhance query for Wikipedia search.
@@ -35,32 +75,11 @@ def clean_query_for_wiki(query: str) -> str:
     Returns:
         Enhanced query string
     """
-    # Initial cleaning
-    query = query.lower()
-    query = re.sub(r'[^\w\s]', '', query)  # remove punctuation
-    
-    # Define AI/tech term mappings
-    ai_terms = {
-        'ia': 'artificial intelligence',
-        'ai': 'artificial intelligence',
-        'ml': 'machine learning',
-        'dl': 'deep learning',
-        'nlp': 'natural language processing'
-    }
-    
-    # Define domain-specific context terms
-    domain_contexts = {
-        'ecology': ['environmental', 'ecosystem', 'biological'],
-        'climate': ['environmental', 'weather', 'atmospheric'],
-        'health': ['medical', 'healthcare', 'clinical'],
-        'economy': ['economic', 'financial', 'market']
-    }
-    
-    # Careful stopword selection (keep important modifiers)
-    stopwords = {
-        'what', 'about', 'how', 'the', 'a', 'an', 'and',
-        'to', 'of', 'for', 'with', 'by'
-    }
+    # Initial cleaning: lowercase and remove punctuation
+    if query.isascii():
+        query = query.translate(_ASCII_LOWER_STRIP)
+    else:
+        query = _PUNCT_RE.sub('', query.lower())
     
     # Split into words
     words = query.split()
@@ -68,14 +87,14 @@ def clean_query_for_wiki(query: str) -> str:
     
     # First pass: replace AI terms and keep non-stopwords
     for word in words:
-        if word in ai_terms:
-            enhanced_words.append(ai_terms[word])
-        elif word not in stopwords:
+        if word in _AI_TERMS:
+            enhanced_words.append(_AI_TERMS[word])
+        elif word not in _STOPWORDS:
             enhanced_words.append(word)
     
     # Add domain context if detected
     query_str = ' '.join(enhanced_words)
-    for domain, context_terms in domain_contexts.items():
+    for domain, context_terms in _DOMAIN_CONTEXTS.items():
         if domain in query_str.lower():
             enhanced_words.extend(context_terms)
     
@@ -0,0 +1,9 @@
+"""
+Shared pytest setup
+"""
+
+import sys
+from pathlib import Path
+
+# Make the src package importable when running pytest from the project root
+sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -0,0 +1,108 @@
+"""
+Tests for the BM25 retriever
+"""
+
+import math
+
+import numpy as np
+import pytest
+
+from src.retrievers.bm25_retriever import BM25Retriever
+from src.retrievers.document_loader import DocChunk
+from src.utils.tokenizer import simple_tokenize
+
+
+TEXTS = [
+    "Climate models simulate the atmosphere and the oceans.",
+    "Machine learning speeds up climate model emulation.",
+    "Photosynthesis converts light into chemical energy in plants.",
+    "Ocean heat content rises as the climate warms.",
+    "Neural networks are a family of machine learning models.",
+    "Plants absorb carbon dioxide during photosynthesis.",
+]
+
+QUERIES = [
+    "climate models",
+    "machine learning",
+    "photosynthesis in plants",
+    "ocean climate warming",
+    "climate climate ocean",
+]
+
+
+def make_chunks(texts):
+    return [
+        DocChunk(page_content=text, metadata={"source": f"doc{i}.pdf", "chunk_id": i})
+        for i, text in enumerate(texts)
+    ]
+
+
+@pytest.fixture
+def retriever():
+    return BM25Retriever(make_chunks(TEXTS))
+
+
+def reference_scores(texts, query):
+    """Unquantized BM25 scores from rank_bm25, with this retriever's IDF"""
+    rank_bm25 = pytest.importorskip("rank_bm25")
+    
+    class BM25(rank_bm25.BM25Okapi):
+        def _calc_idf(self, nd):
+            for word, freq in nd.items():
+                self.idf[word] = math.log(1 + (self.corpus_size - freq + 0.5) / (freq + 0.5))
+    
+    bm25 = BM25([simple_tokenize(t) for t in texts], k1=1.5, b=0.75)
+    return bm25.get_scores(simple_tokenize(query))
+
+
+@pytest.mark.parametrize("query", QUERIES)
+def test_scores_match_rank_bm25(retriever, query):
+    expected = reference_scores(TEXTS, query)
+    q_tokens = simple_tokenize(query)
+    
+    scores = retriever.get_scores(q_tokens)
+    
+    # uint8 weights are off by at most half a quantization step per term
+    idf = [retriever.idf[retriever.vocab[t]] for t in q_tokens if t in retriever.vocab]
+    tolerance = 0.5 * retriever.weight_scale * sum(idf) + 1e-5
+    np.testing.assert_allclose(scores, expected, rtol=0, atol=tolerance)
+    assert np.argmax(scores) == np.argmax(expected)
+
+
+def test_k_zero_returns_nothing(retriever):
+    assert retriever.get_relevant_documents("climate", k=0) == []
+
+
+def test_empty_query_returns_nothing(retriever):
+    assert retriever.get_relevant_documents("", k=3) == []
+    assert retriever.get_relevant_documents("? !", k=3) == []
+
+
+def test_unknown_terms_fall_back_to_first_documents(retriever):
+    docs = retriever.get_relevant_documents("zebra quasar", k=2)
+    
+    assert docs == retriever.chunks[:2]
+
+
+def test_only_matching_documents_are_returned(retriever):
+    docs = retriever.get_relevant_documents("photosynthesis", k=4)
+    
+    assert {d.metadata["chunk_id"] for d in docs} == {2, 5}
+
+
+def test_single_document():
+    retriever = BM25Retriever(make_chunks(["Glaciers retreat as temperatures rise."]))
+    
+    assert retriever.get_relevant_documents("glaciers", k=5) == retriever.chunks
+    assert retriever.get_relevant_documents("volcano", k=5) == retriever.chunks
+
+
+def test_save_load_round_trip(retriever, tmp_path):
+    retriever.save(tmp_path / "index")
+    loaded = BM25Retriever.load(tmp_path / "index")
+    
+    assert loaded.chunks == retriever.chunks
+    for query in QUERIES:
+        q_tokens = simple_tokenize(query)
+        np.testing.assert_array_equal(loaded.get_scores(q_tokens), retriever.get_scores(q_tokens))
+        assert loaded.get_relevant_documents(query, k=3) == retriever.get_relevant_documents(query, k=3)
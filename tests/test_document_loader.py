@@ -0,0 +1,73 @@
+"""
+Tests for the PDF text splitter
+"""
+
+import pytest
+
+from src.retrievers.document_loader import _fast_split
+
+
+WORDS = [f"word{i}" for i in range(300)]
+
+TEXTS = {
+    "words": " ".join(WORDS),
+    "lines": "\n".join(" ".join(WORDS[i:i + 7]) for i in range(0, 300, 7)),
+    "paragraphs": "\n\n".join(
+        "\n".join(" ".join(WORDS[j:j + 5]) for j in range(i, i + 30, 5))
+        for i in range(0, 300, 30)
+    ),
+}
+
+
+def shared_words(prev: str, nxt: str) -> int:
+    """Number of trailing words of prev that start nxt"""
+    prev_words, next_words = prev.split(), nxt.split()
+    for n in range(min(len(prev_words), len(next_words)), 0, -1):
+        if prev_words[-n:] == next_words[:n]:
+            return n
+    return 0
+
+
+@pytest.mark.parametrize("name", TEXTS)
+@pytest.mark.parametrize("size, overlap", [(50, 0), (80, 20), (200, 60)])
+def test_chunks_respect_max_size(name, size, overlap):
+    chunks = _fast_split(TEXTS[name], size, overlap)
+    
+    assert chunks
+    assert all(0 < len(chunk) <= size for chunk in chunks)
+
+
+@pytest.mark.parametrize("name", TEXTS)
+@pytest.mark.parametrize("size, overlap", [(50, 0), (80, 20), (200, 60)])
+def test_words_are_preserved(name, size, overlap):
+    chunks = _fast_split(TEXTS[name], size, overlap)
+    
+    chunk_words = [word for chunk in chunks for word in chunk.split()]
+    
+    # No word is cut or lost, and words first appear in text order
+    assert list(dict.fromkeys(chunk_words)) == WORDS
+
+
+@pytest.mark.parametrize("size, overlap", [(80, 20), (200, 60)])
+def test_consecutive_chunks_overlap(size, overlap):
+    chunks = _fast_split(TEXTS["words"], size, overlap)
+    
+    for prev, nxt in zip(chunks, chunks[1:]):
+        shared = shared_words(prev, nxt)
+        assert shared > 0
+        assert len(" ".join(nxt.split()[:shared])) <= overlap
+
+
+def test_no_overlap_when_disabled():
+    chunks = _fast_split(TEXTS["words"], 50, 0)
+    
+    assert all(shared_words(prev, nxt) == 0 for prev, nxt in zip(chunks, chunks[1:]))
+
+
+def test_text_without_separators_is_cut_at_fixed_offsets():
+    text = "x" * 250
+    
+    chunks = _fast_split(text, 100, 10)
+    
+    assert all(len(chunk) <= 100 for chunk in chunks)
+    assert chunks[0] + "".join(chunk[10:] for chunk in chunks[1:]) == text
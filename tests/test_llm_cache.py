@@ -0,0 +1,42 @@
+"""
+Tests for the LLM response cache and its sqlite store
+"""
+
+import sqlite3
+
+from src.utils.http_cache import SqliteCache
+from src.utils.llm_cache import LLMCache
+
+
+def test_clear_drops_disk_entries(tmp_path):
+    cache = LLMCache(path=tmp_path / "llm.sqlite3")
+    cache.update("prompt", "model", ["response"])
+    
+    cache.clear()
+    
+    assert cache.lookup("prompt", "model") is None
+    reopened = LLMCache(path=tmp_path / "llm.sqlite3")
+    assert reopened.lookup("prompt", "model") is None
+
+
+def test_entries_survive_reopen(tmp_path):
+    cache = LLMCache(path=tmp_path / "llm.sqlite3")
+    cache.update("prompt", "model", ["response"])
+    cache.disk.close()
+    
+    reopened = LLMCache(path=tmp_path / "llm.sqlite3")
+    assert reopened.lookup("prompt", "model") == ["response"]
+
+
+def test_expired_rows_are_deleted(tmp_path):
+    path = tmp_path / "cache.sqlite3"
+    cache = SqliteCache(path)
+    cache.set("old", "value", ttl=-1)
+    assert cache.get("old") == (False, None)
+    
+    cache.set("new", "value", ttl=60)
+    cache.close()
+    
+    with sqlite3.connect(str(path)) as conn:
+        keys = [row[0] for row in conn.execute("SELECT key FROM cache")]
+    assert keys == ["new"]
@@ -0,0 +1,90 @@
+"""
+Tests for the backend research service lifecycle
+"""
+
+import threading
+
+import pytest
+
+import backend.research_service as research_service
+from backend.research_service import ResearchService
+
+
+class FakeResearchSystem:
+    """Stands in for ResearchSystem; research() blocks until released"""
+    
+    instances = []
+    
+    def __init__(self, api_key=None, files_dir=None, use_wikipedia=True, use_arxiv=True,
+                 max_wikipedia_articles=3, max_arxiv_papers=3):
+        self.use_wikipedia = use_wikipedia
+        self.use_arxiv = use_arxiv
+        self.max_wikipedia_articles = max_wikipedia_articles
+        self.max_arxiv_papers = max_arxiv_papers
+        self.retriever = None
+        self.closed = False
+        self.started = threading.Event()
+        self.proceed = threading.Event()
+        self.proceed.set()
+        FakeResearchSystem.instances.append(self)
+    
+    def initialize(self):
+        pass
+    
+    def research(self, topic):
+        assert not self.closed
+        self.started.set()
+        self.proceed.wait(5)
+        assert not self.closed
+        return {key: topic for key in ("topic", "summary", "critique_A", "critique_B", "insight")}
+    
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def service(monkeypatch):
+    FakeResearchSystem.instances = []
+    monkeypatch.setattr(research_service, "ResearchSystem", FakeResearchSystem)
+    monkeypatch.setattr(research_service.Config, "GROQ_API_KEY", "test-key")
+    service = ResearchService()
+    service.initialize()
+    return service
+
+
+def test_same_configuration_does_not_reinitialize(service):
+    service.research("topic", use_wikipedia=True, use_arxiv=True,
+                     max_wikipedia_articles=3, max_arxiv_papers=3)
+    
+    assert len(FakeResearchSystem.instances) == 1
+    assert not service.system.closed
+
+
+def test_replaced_system_is_closed_after_its_last_run(service):
+    first = service.system
+    first.proceed.clear()
+    
+    worker = threading.Thread(target=service.research, args=("slow topic",))
+    worker.start()
+    assert first.started.wait(5)
+    
+    # A request with another configuration swaps in a new system while the
+    # first run is still going
+    service.research("topic", use_arxiv=False)
+    second = service.system
+    assert second is not first
+    assert not first.closed
+    
+    first.proceed.set()
+    worker.join(5)
+    assert first.closed
+    assert not second.closed
+
+
+def test_close_shuts_down_idle_system(service):
+    system = service.system
+    
+    service.close()
+    
+    assert system.closed
+    assert not service.is_initialized()
@@ -0,0 +1,64 @@
+"""
+Tests for the researcher agent
+"""
+
+import asyncio
+
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+
+from src.agents.researcher_agent import ResearcherAgent
+
+
+class FakeWikipediaScraper:
+    """Returns canned articles in the format of WikipediaScraper.ascrape_by_keywords"""
+    
+    def __init__(self, articles):
+        self.articles = articles
+    
+    async def ascrape_by_keywords(self, keywords, max_articles=5):
+        return {
+            "articles": self.articles[:max_articles],
+            "is_fallback": False,
+            "message": f"Found {len(self.articles)} directly relevant articles."
+        }
+
+
+def test_wikipedia_articles_reach_sources():
+    llm = FakeListChatModel(responses=["Photosynthesis converts light into energy."])
+    scraper = FakeWikipediaScraper([{
+        "title": "Photosynthesis",
+        "content": "Photosynthesis is the process used by plants.",
+        "url": "https://en.wikipedia.org/wiki/Photosynthesis"
+    }])
+    agent = ResearcherAgent(llm, wikipedia_scraper=scraper)
+    
+    result = agent.process({"topic": "photosynthesis"})
+    
+    assert result["sources"] == ["Wikipedia: Photosynthesis"]
+    assert result["summary"] == "Photosynthesis converts light into energy."
+
+
+def test_no_wikipedia_articles_gives_no_sources_summary():
+    llm = FakeListChatModel(responses=["unused"])
+    agent = ResearcherAgent(llm, wikipedia_scraper=FakeWikipediaScraper([]))
+    
+    result = agent.process({"topic": "photosynthesis"})
+    
+    assert result["sources"] == []
+
+
+def test_process_inside_running_event_loop():
+    llm = FakeListChatModel(responses=["Summary."])
+    scraper = FakeWikipediaScraper([{
+        "title": "Photosynthesis",
+        "content": "Photosynthesis is the process used by plants.",
+        "url": "https://en.wikipedia.org/wiki/Photosynthesis"
+    }])
+    agent = ResearcherAgent(llm, wikipedia_scraper=scraper)
+    
+    async def call_sync_api():
+        return agent.process({"topic": "photosynthesis"})
+    
+    result = asyncio.run(call_sync_api())
+    
+    assert result["sources"] == ["Wikipedia: Photosynthesis"]
@@ -0,0 +1,91 @@
+"""
+Tests for splitting the combined reviewer response into critiques
+"""
+
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+
+from src.agents.reviewer_agent import CombinedReviewerAgent
+
+
+def make_agent(response: str = "") -> CombinedReviewerAgent:
+    return CombinedReviewerAgent(FakeListChatModel(responses=[response]))
+
+
+def test_markdown_headers():
+    response = "## Reviewer A\n- claim X lacks support\n\n## Reviewer B\n- source bias"
+    
+    critiques = make_agent()._split_critiques(response)
+    
+    assert critiques == {
+        "critique_A": "- claim X lacks support",
+        "critique_B": "- source bias"
+    }
+
+
+def test_bold_header_keeps_text_on_the_same_line():
+    response = (
+        "**Reviewer A:** The summary overstates the findings.\n"
+        "- missing sample sizes\n"
+        "**Reviewer B**: Only one source is cited."
+    )
+    
+    critiques = make_agent()._split_critiques(response)
+    
+    assert critiques["critique_A"] == (
+        "The summary overstates the findings.\n- missing sample sizes"
+    )
+    assert critiques["critique_B"] == "Only one source is cited."
+
+
+def test_bullet_mentioning_other_reviewer_is_not_a_header():
+    response = (
+        "## Reviewer A\n"
+        "* Reviewer B would probably question the dataset.\n"
+        "* The conclusion is not supported.\n"
+        "## Reviewer B\n"
+        "* Alternative explanations are ignored."
+    )
+    
+    critiques = make_agent()._split_critiques(response)
+    
+    assert critiques["critique_A"] == (
+        "* Reviewer B would probably question the dataset.\n"
+        "* The conclusion is not supported."
+    )
+    assert critiques["critique_B"] == "* Alternative explanations are ignored."
+
+
+def test_bare_header_lines():
+    response = "Reviewer A:\n- point a\nReviewer B\n- point b"
+    
+    critiques = make_agent()._split_critiques(response)
+    
+    assert critiques == {"critique_A": "- point a", "critique_B": "- point b"}
+
+
+def test_missing_sections_fall_back_to_full_response():
+    response = "  The summary is reasonable but lacks citations.  "
+    
+    critiques = make_agent()._split_critiques(response)
+    
+    assert critiques == {
+        "critique_A": "The summary is reasonable but lacks citations.",
+        "critique_B": "The summary is reasonable but lacks citations."
+    }
+
+
+def test_missing_section_falls_back_for_that_reviewer_only():
+    response = "## Reviewer A\n- point a"
+    
+    critiques = make_agent()._split_critiques(response)
+    
+    assert critiques["critique_A"] == "- point a"
+    assert critiques["critique_B"] == response
+
+
+def test_process_splits_model_response():
+    agent = make_agent("## Reviewer A\n- point a\n## Reviewer B\n- point b")
+    
+    result = agent.process({"topic": "t", "summary": "s"})
+    
+    assert result == {"critique_A": "- point a", "critique_B": "- point b"}